@@ -20,6 +20,13 @@ from datetime import datetime
 from wikiaccess.database import ConversionDatabase
 from wikiaccess.unified import convert_multiple_pages
 
+SEPARATOR = '=' * 70
+
+
+def print_banner(title: str):
+    """Print a section title between separator lines."""
+    print(f"\n{SEPARATOR}\n{title}\n{SEPARATOR}")
+
 
 def main():
     """Convert approved discovered pages."""
@@ -91,9 +98,8 @@ def main():
         db.close()
         return 0
 
-    print(f"\n{'='*70}")
-    print(f"Converting Approved Discovered Pages")
-    print(f"{'='*70}\n")
+    print_banner("Converting Approved Discovered Pages")
+    print()
 
     print(f"Found {len(approved_pages)} approved pages for conversion")
 
@@ -101,9 +107,8 @@ def main():
     if args.max_depth is not None:
         print(f"  Limited to depth: {args.max_depth}")
 
-    print(f"\nPages to convert:")
-    for i, page_id in enumerate(approved_pages, 1):
-        print(f"  {i}. {page_id}")
+    print("\nPages to convert:")
+    print("\n".join(f"  {i}. {page_id}" for i, page_id in enumerate(approved_pages, 1)))
 
     # Dry run?
     if args.dry_run:
@@ -132,13 +137,7 @@ def main():
     db.start_batch(batch_id, args.wiki_url)
 
     # Determine the discovery depth of the approved pages (they should all be at the same depth)
-    discovery_depths = [db.conn.execute(
-        'SELECT discovery_depth FROM discovered_pages WHERE target_page_id = ?',
-        (page_id,)
-    ).fetchone() for page_id in approved_pages]
-
-    # Get the max depth from the approved pages
-    max_approved_depth = max([d[0] for d in discovery_depths if d], default=0)
+    max_approved_depth = db.get_max_approved_depth(args.max_depth)
 
     print(f"  ℹ️  Approved pages depth info: {len(approved_pages)} pages, max_depth={max_approved_depth}")
 
@@ -166,12 +165,12 @@ def main():
         )
 
         # Update conversion status in database
-        print(f"\n{'='*70}")
-        print(f"Updating Discovery Status")
-        print(f"{'='*70}\n")
+        print_banner("Updating Discovery Status")
+        print()
 
         converted_count = 0
         failed_count = 0
+        converted_ids = []
 
         for page_id, result in results.items():
             # Skip if page was skipped
@@ -186,17 +185,21 @@ def main():
                 continue
 
             # If no error and not skipped, it was successful
-            try:
-                db.mark_discovered_as_converted(page_id, batch_id)
-                converted_count += 1
-                print(f"✓ {page_id}: converted")
-            except Exception as e:
-                print(f"⚠️  {page_id}: error updating status - {e}")
-                failed_count += 1
-
-        print(f"\n{'='*70}")
-        print(f"Conversion Summary")
-        print(f"{'='*70}")
+            converted_ids.append(page_id)
+
+        # Record all successful pages in one transaction (one commit, not one per page)
+        try:
+            updated_ids = db.bulk_mark_discovered_as_converted(converted_ids, batch_id)
+            converted_count = len(converted_ids)
+            if updated_ids:
+                print("\n".join(f"✓ {page_id}: converted" for page_id in updated_ids))
+            for page_id in set(converted_ids).difference(updated_ids):
+                print(f"⚠️  {page_id}: converted, but no discovered page record to update")
+        except Exception as e:
+            print(f"⚠️  Error updating status for {len(converted_ids)} pages - {e}")
+            failed_count += len(converted_ids)
+
+        print_banner("Conversion Summary")
         print(f"  Converted: {converted_count}")
         print(f"  Failed: {failed_count}")
         print(f"  Total: {converted_count + failed_count}")
@@ -1,15 +1,18 @@
 #!/usr/bin/env python3
 """Convert URLs from URLS.txt to accessible HTML, DOCX, and Markdown"""
 
+import os
 import sys
+from functools import lru_cache
 from pathlib import Path
 from urllib.parse import urlparse, parse_qs
-from wikiaccess.unified import convert_multiple_pages
 
 # Configuration
 URL_FILE = 'URLS.txt'
 OUTPUT_DIR = 'output'
+JOBS = max(1, (os.cpu_count() or 2) - 1)  # Pages converted in parallel
 
+@lru_cache(maxsize=4096)
 def parse_dokuwiki_url(url):
     """Extract base URL and page ID from a DokuWiki URL"""
     parsed = urlparse(url)
@@ -47,6 +50,9 @@ def main():
         print(f"Error: Could not parse wiki URL")
         sys.exit(1)
     
+    # Imported here so URL-file errors are reported without loading the converters
+    from wikiaccess.unified import convert_multiple_pages
+
     # Use unified interface to convert multiple pages
     # This generates Markdown + HTML + DOCX + Accessibility reports
     results = convert_multiple_pages(
@@ -54,7 +60,8 @@ def main():
         page_names=page_ids,
         output_dir=OUTPUT_DIR,
         formats=['html', 'docx'],
-        check_accessibility=True
+        check_accessibility=True,
+        jobs=JOBS
     )
     
     # Summary
@@ -9,6 +9,7 @@ pages that exist in the database. This script updates those link statuses from
 Usage:
     python resolve_broken_links.py              # Uses default database
     python resolve_broken_links.py --db <path>  # Use specific database
+    python resolve_broken_links.py --regenerate-reports  # Also rebuild all reports
 """
 
 import argparse
@@ -27,6 +28,16 @@ def main():
         default='output/conversion_history.db',
         help='Path to database'
     )
+    parser.add_argument(
+        '--regenerate-reports',
+        action='store_true',
+        help='Regenerate all reports afterwards, reusing this database connection'
+    )
+    parser.add_argument(
+        '--output',
+        default='output',
+        help='Output directory for regenerated reports (default: output)'
+    )
 
     args = parser.parse_args()
 
@@ -43,22 +54,19 @@ def main():
         print(f"{'='*70}\n")
 
         # Get count before
-        before_broken = db.conn.execute('''
-            SELECT COUNT(*) FROM links WHERE resolution_status='missing' AND link_type='internal'
-        ''').fetchone()[0]
+        before_broken = db.get_broken_link_summary()['references']
 
         print(f"Before: {before_broken} broken links")
 
         # Resolve converted links
         resolved_count = db.resolve_converted_links()
 
-        # Get count after
-        after_broken = db.conn.execute('''
-            SELECT COUNT(*) FROM links WHERE resolution_status='missing' AND link_type='internal'
-        ''').fetchone()[0]
+        # One summary query after resolving serves both the "After" line and
+        # the remaining-links section below
+        summary = db.get_broken_link_summary()
 
         print(f"Resolved: {resolved_count} links that now point to converted pages")
-        print(f"After: {after_broken} broken links remaining")
+        print(f"After: {summary['references']} broken links remaining")
         print(f"\n✓ Link resolution complete!")
 
         # Show what's still broken
@@ -66,15 +74,22 @@ def main():
         print(f"Remaining Broken Links Summary")
         print(f"{'='*70}\n")
 
-        remaining_broken = db.get_all_broken_links()
-        print(f"Total unique broken link targets: {len(remaining_broken)}")
-        print(f"Total broken link references: {sum(l['reference_count'] for l in remaining_broken)}")
+        print(f"Total unique broken link targets: {summary['targets']}")
+        print(f"Total broken link references: {summary['references']}")
 
         # Show top remaining broken links
         print(f"\nTop remaining missing pages:")
-        for link in remaining_broken[:10]:
+        for link in db.get_top_broken_links(10):
             print(f"  - {link['target_page_id']}: {link['reference_count']} references")
 
+        if args.regenerate_reports:
+            # Imported here so a plain resolve run doesn't load the report stack
+            from wikiaccess.report_regenerator import ReportRegenerator
+            results = ReportRegenerator(args.output).regenerate_all(db)
+            for report_type, path in results.items():
+                status = "✓" if path else "✗"
+                print(f"  {status} {report_type}: {path}")
+
         return 0
 
     except Exception as e:
@@ -20,6 +20,16 @@ setup(
     long_description_content_type="text/markdown",
     url="https://github.com/yourusername/wikiaccess",
     packages=find_packages(),
+    # Report templates, HTML fragments and static assets are read from the
+    # package directory at runtime, so they must ship with it
+    package_data={
+        'wikiaccess': [
+            'templates/*.html',
+            'templates/fragments/*.html',
+            'static/css/*.css',
+            'static/js/*.js',
+        ],
+    },
     entry_points={
         'console_scripts': [
             'wikiaccess=wikiaccess.cli:main',
@@ -30,7 +40,6 @@ setup(
     install_requires=[
         "python-docx>=0.8.11",
         "requests>=2.31.0",
-        "beautifulsoup4>=4.9.0",
         "lxml>=4.6.0",
         "Pillow>=10.0.0",
     ],
@@ -1,22 +1,21 @@
 #!/usr/bin/env python3
 """Test broken links analysis"""
 
-from wikiaccess.database import ConversionDatabase
+from wikiaccess.database import get_default_db
 
 def main():
     print("\n" + "="*70)
     print("Broken Links Analysis")
     print("="*70 + "\n")
 
-    db = ConversionDatabase()
-    links = db.get_all_broken_links()
+    db = get_default_db(read_only=True)
+    summary = db.get_broken_link_summary()
 
-    print(f"Total unique missing pages: {len(links)}")
-    total_refs = sum(l['reference_count'] for l in links)
-    print(f"Total broken link references: {total_refs}\n")
+    print(f"Total unique missing pages: {summary['targets']}")
+    print(f"Total broken link references: {summary['references']}\n")
 
     print("Top 10 most referenced missing pages:")
-    for i, link in enumerate(sorted(links, key=lambda x: x['reference_count'], reverse=True)[:10], 1):
+    for i, link in enumerate(db.get_top_broken_links(10), 1):
         print(f"  {i}. {link['target_page_id']}: {link['reference_count']} references")
 
     print("\n" + "="*70)
@@ -1,31 +1,21 @@
 #!/usr/bin/env python3
 """Test discovery workflow status"""
 
-from wikiaccess.database import ConversionDatabase
+from wikiaccess.database import get_default_db
 
 def main():
     print("\n" + "="*70)
     print("Discovery Workflow Status")
     print("="*70 + "\n")
 
-    db = ConversionDatabase()
+    db = get_default_db(read_only=True)
 
-    # Get status counts
-    discovered = db.conn.execute(
-        'SELECT COUNT(*) FROM discovered_pages WHERE discovery_status = "discovered"'
-    ).fetchone()[0]
-
-    approved = db.conn.execute(
-        'SELECT COUNT(*) FROM discovered_pages WHERE discovery_status = "approved"'
-    ).fetchone()[0]
-
-    skipped = db.conn.execute(
-        'SELECT COUNT(*) FROM discovered_pages WHERE discovery_status = "skipped"'
-    ).fetchone()[0]
-
-    converted = db.conn.execute(
-        'SELECT COUNT(*) FROM discovered_pages WHERE discovery_status = "converted"'
-    ).fetchone()[0]
+    # Get status counts (one GROUP BY scan)
+    counts = db.get_discovery_status_counts()
+    discovered = counts['discovered']
+    approved = counts['approved']
+    skipped = counts['skipped']
+    converted = counts['converted']
 
     print("Page Status:")
     print(f"  Discovered (pending review): {discovered}")
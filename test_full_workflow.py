@@ -1,25 +1,34 @@
 #!/usr/bin/env python3
 """Full interactive test of WikiAccess minimal version"""
 
-from wikiaccess.database import ConversionDatabase
+from wikiaccess.database import get_default_db
 from wikiaccess.report_regenerator import ReportRegenerator
 from pathlib import Path
+import os
+
+
+def count_files(directory: Path, suffix: str = '') -> int:
+    """Count entries in a directory whose names end with suffix, in one scandir pass"""
+    try:
+        with os.scandir(directory) as entries:
+            return sum(1 for entry in entries if entry.name.endswith(suffix))
+    except FileNotFoundError:
+        return 0
+
 
 def main():
     print("\n" + "="*70)
     print("WikiAccess - Full Workflow Test")
     print("="*70 + "\n")
 
-    db = ConversionDatabase()
+    db = get_default_db(read_only=True)
 
     # 1. Database stats
     print("1. DATABASE STATISTICS")
-    pages = db.get_all_pages_with_scores()
-    images = db.get_all_images_for_report()
-    broken_links = db.get_all_broken_links()
-    print(f"   Pages: {len(pages)}")
-    print(f"   Images: {len(images)}")
-    print(f"   Broken links: {len(broken_links)}")
+    report_counts = db.get_report_counts()
+    print(f"   Pages: {report_counts['pages']}")
+    print(f"   Images: {report_counts['images']}")
+    print(f"   Broken links: {report_counts['broken_links']}")
 
     # 2. Regenerate reports
     print("\n2. REGENERATING REPORTS")
@@ -32,26 +41,18 @@ def main():
 
     # 3. Discovery stats
     print("\n3. DISCOVERY WORKFLOW")
-    discovered = db.conn.execute(
-        'SELECT COUNT(*) FROM discovered_pages'
-    ).fetchone()[0]
-    approved = db.conn.execute(
-        'SELECT COUNT(*) FROM discovered_pages WHERE discovery_status = "approved"'
-    ).fetchone()[0]
-    converted = db.conn.execute(
-        'SELECT COUNT(*) FROM discovered_pages WHERE discovery_status = "converted"'
-    ).fetchone()[0]
-    print(f"   Discovered: {discovered}")
-    print(f"   Approved: {approved}")
-    print(f"   Converted: {converted}")
+    counts = db.get_discovery_status_counts()
+    print(f"   Discovered: {counts['total']}")
+    print(f"   Approved: {counts['approved']}")
+    print(f"   Converted: {counts['converted']}")
 
     # 4. Output files
     print("\n4. GENERATED FILES")
     output_dir = Path('output')
-    html_files = len(list(output_dir.glob('html/*.html')))
-    docx_files = len(list(output_dir.glob('docx/*.docx')))
-    md_files = len(list(output_dir.glob('*.md')))
-    img_files = len(list(output_dir.glob('images/*')))
+    html_files = count_files(output_dir / 'html', '.html')
+    docx_files = count_files(output_dir / 'docx', '.docx')
+    md_files = count_files(output_dir, '.md')
+    img_files = count_files(output_dir / 'images')
     print(f"   HTML: {html_files}")
     print(f"   DOCX: {docx_files}")
     print(f"   Markdown: {md_files}")
@@ -24,15 +24,37 @@ __version__ = "2.0.0"
 __author__ = "Your Name"
 __email__ = "your.email@example.com"
 
-# Core functionality imports
-from .scraper import DokuWikiHTTPClient
-from .parser import DokuWikiParser, AccessibilityManager
-from .markdown_converter import MarkdownConverter
-from .accessibility import AccessibilityChecker
-from .reporting import ReportGenerator
-
-# Convenience imports for common use cases
-from .unified import convert_wiki_page, convert_multiple_pages
+import importlib
+
+# Public names and the submodules that define them. They are imported on first
+# access (PEP 562), so scripts that only need e.g. wikiaccess.database don't
+# pay for the scraper, converter and reporting imports.
+_LAZY_IMPORTS = {
+    # Core functionality
+    'DokuWikiHTTPClient': '.scraper',
+    'DokuWikiParser': '.parser',
+    'AccessibilityManager': '.parser',
+    'MarkdownConverter': '.markdown_converter',
+    'AccessibilityChecker': '.accessibility',
+    'ReportGenerator': '.reporting',
+
+    # Convenience imports for common use cases
+    'convert_wiki_page': '.unified',
+    'convert_multiple_pages': '.unified',
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_IMPORTS:
+        value = getattr(importlib.import_module(_LAZY_IMPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
+
 
 __all__ = [
     # Core classes
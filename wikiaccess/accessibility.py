@@ -8,26 +8,49 @@ Provides industry-standard accessibility validation.
 Part of WikiAccess: Transform DokuWiki into Accessible Documents
 """
 
+import hashlib
 import json
+import shutil
 import subprocess
-import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
+from urllib.parse import unquote, urlparse
 import os
 
+import lxml.html
+from lxml import etree
+
+from .static_helper import write_text_atomic
+
 try:
     from docx import Document
+    from docx.enum.style import WD_STYLE_TYPE
 except ImportError:
     Document = None
 
 
 class AccessibilityChecker:
     """Check WCAG 2.1 compliance using pa11y for HTML and custom checks for DOCX"""
-    
-    def __init__(self):
+
+    # Bump when check_html()'s result format or scoring changes
+    HTML_CACHE_VERSION = 2
+    # pa11y exits 0 for a clean page and 2 when it reports issues; anything
+    # else means it failed to produce a report
+    PA11Y_REPORT_EXIT_CODES = (0, 2)
+
+    def __init__(self, cache_dir: Optional[str] = None):
+        """
+        Args:
+            cache_dir: Optional directory for check_html() results keyed by
+                the HTML file's content hash; unchanged pages then skip pa11y
+        """
         self.pa11y_path = self._find_pa11y()
         if not self.pa11y_path:
             raise RuntimeError("pa11y not found. Install with: npm install pa11y")
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        if self.cache_dir:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
     
     def _find_pa11y(self) -> Optional[str]:
         """Find pa11y executable"""
@@ -36,15 +59,8 @@ class AccessibilityChecker:
         if local_pa11y.exists():
             return str(local_pa11y.absolute())
         
-        # Check global installation
-        try:
-            result = subprocess.run(["which", "pa11y"], capture_output=True, text=True)
-            if result.returncode == 0:
-                return result.stdout.strip()
-        except:
-            pass
-        
-        return None
+        # Check global installation (PATH lookup without spawning `which`)
+        return shutil.which("pa11y")
     
     def check_html(self, html_path: str) -> Dict:
         """
@@ -70,12 +86,77 @@ class AccessibilityChecker:
                 'total_tests': 0,
                 'file': html_path
             }
-        
-        # Run pa11y with WCAG2AA standard
-        aa_results = self._run_pa11y(html_path, "WCAG2AA")
-        
-        # Run pa11y with WCAG2AAA standard  
-        aaa_results = self._run_pa11y(html_path, "WCAG2AAA")
+
+        cache_path = self._html_cache_path(html_path)
+        if cache_path is not None:
+            try:
+                with open(cache_path, encoding='utf-8') as f:
+                    cached = json.load(f)
+                cached['file'] = html_path
+                return cached
+            except (OSError, ValueError):
+                pass
+
+        result, complete = self._check_html_with_pa11y(html_path)
+        # Only results where both pa11y runs produced a report are kept
+        if cache_path is not None and complete:
+            try:
+                write_text_atomic(cache_path, json.dumps(result))
+            except OSError:
+                pass
+        return result
+
+    def _html_cache_path(self, html_path: str) -> Optional[Path]:
+        """Cache file for an HTML file's current content, or None if caching is off
+
+        The key covers the HTML bytes and every local stylesheet the page
+        links, since the CSS drives pa11y's contrast results.
+        """
+        if self.cache_dir is None:
+            return None
+        digest = hashlib.sha256(f"{self.HTML_CACHE_VERSION}:{self.pa11y_path}:".encode('utf-8'))
+        with open(html_path, 'rb') as f:
+            html_bytes = f.read()
+        digest.update(html_bytes)
+        for href in self._stylesheet_hrefs(html_bytes):
+            digest.update(f"\0{href}\0".encode('utf-8'))
+            parsed = urlparse(href)
+            if parsed.scheme or parsed.netloc:
+                continue  # Remote stylesheet; only its URL is part of the key
+            try:
+                css_bytes = (Path(html_path).parent / unquote(parsed.path)).read_bytes()
+                digest.update(hashlib.sha256(css_bytes).digest())
+            except OSError:
+                digest.update(b'missing')
+        return self.cache_dir / f"{digest.hexdigest()}.json"
+
+    @staticmethod
+    def _stylesheet_hrefs(html_bytes: bytes) -> List[str]:
+        """hrefs of the <link rel="stylesheet"> elements in an HTML document"""
+        if not html_bytes.strip():
+            return []
+        try:
+            root = lxml.html.document_fromstring(html_bytes)
+        except (etree.ParserError, ValueError):
+            return []
+        return root.xpath(
+            '//link[contains(concat(" ", normalize-space(translate(@rel, "STYLESHEET", "stylesheet")), " "),'
+            ' " stylesheet ")]/@href'
+        )
+
+    def _check_html_with_pa11y(self, html_path: str) -> Tuple[Dict, bool]:
+        """Run pa11y on an existing HTML file and build the check_html() result
+
+        Returns:
+            Tuple of (check_html() result, whether both pa11y runs produced a
+            valid report and the result may be cached)
+        """
+        # Run pa11y with the WCAG2AA and WCAG2AAA standards; each run is its
+        # own Node/Chromium process, so the AAA run goes alongside the AA one
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            aaa_future = executor.submit(self._run_pa11y, html_path, "WCAG2AAA")
+            aa_results, aa_ok = self._run_pa11y(html_path, "WCAG2AA")
+            aaa_results, aaa_ok = aaa_future.result()
         
         # Process results
         aa_issues = self._process_pa11y_results(aa_results, "AA")
@@ -107,10 +188,16 @@ class AccessibilityChecker:
             'passes': passes,
             'total_tests': estimated_total_checks,
             'file': html_path
-        }
+        }, aa_ok and aaa_ok
     
-    def _run_pa11y(self, html_path: str, standard: str) -> List[Dict]:
-        """Run pa11y with specified standard"""
+    def _run_pa11y(self, html_path: str, standard: str) -> Tuple[List[Dict], bool]:
+        """Run pa11y with specified standard
+
+        Returns:
+            Tuple of (pa11y results, whether pa11y produced a valid report).
+            A failed run (crash, Chromium launch failure, unparseable output)
+            yields a single "pa11y error:" issue instead of an empty, clean result.
+        """
         try:
             # Convert to file URL for pa11y
             file_url = f"file://{os.path.abspath(html_path)}"
@@ -125,13 +212,18 @@ class AccessibilityChecker:
             
             result = subprocess.run(cmd, capture_output=True, text=True)
             
-            if result.stdout:
-                return json.loads(result.stdout)
-            else:
-                return []
+            if result.returncode not in self.PA11Y_REPORT_EXIT_CODES:
+                detail = result.stderr.strip().splitlines()[-1] if result.stderr.strip() else 'no output'
+                return [{"message": f"pa11y error: exited with status {result.returncode} ({detail})",
+                         "type": "error"}], False
+            
+            results = json.loads(result.stdout)
+            if not isinstance(results, list):
+                raise ValueError("unexpected pa11y report format")
+            return results, True
                 
         except Exception as e:
-            return [{"message": f"pa11y error: {str(e)}", "type": "error"}]
+            return [{"message": f"pa11y error: {str(e)}", "type": "error"}], False
     
     def _process_pa11y_results(self, results: List[Dict], level: str) -> List[str]:
         """Process pa11y JSON results into formatted issue strings"""
@@ -153,6 +245,32 @@ class AccessibilityChecker:
         
         return issues
     
+    def check_documents(self, html_path: Optional[str] = None,
+                        docx_path: Optional[str] = None) -> Dict[str, Dict]:
+        """
+        Check a page's HTML and DOCX output in one pass
+
+        The DOCX checks run in-process while pa11y checks the HTML, so the
+        DOCX time is hidden behind the pa11y subprocesses.
+
+        Args:
+            html_path: HTML file to check with pa11y (optional)
+            docx_path: DOCX file to check (optional)
+
+        Returns:
+            Dictionary with 'html' and/or 'docx' keys holding the check_html()
+            and check_docx() results
+        """
+        results = {}
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            html_future = executor.submit(self.check_html, html_path) if html_path else None
+            docx_result = self.check_docx(docx_path) if docx_path else None
+            if html_future:
+                results['html'] = html_future.result()
+        if docx_result is not None:
+            results['docx'] = docx_result
+        return results
+
     def check_docx(self, docx_path: str) -> Dict:
         """
         Check DOCX file for accessibility - uses custom implementation
@@ -216,10 +334,16 @@ class AccessibilityChecker:
     
     def _check_docx_headings(self, doc: Any, issues: List, passes: List):
         """Check heading structure"""
+        # para.style searches the styles part for every paragraph, so each
+        # distinct style id is resolved once and reused
+        style_names = {}
         heading_styles = []
-        for para in doc.paragraphs:
-            if para.style.name.startswith('Heading'):
-                heading_styles.append(para.style.name)
+        for p in doc.element.body.p_lst:
+            style_id = p.style
+            if style_id not in style_names:
+                style_names[style_id] = doc.styles.get_by_id(style_id, WD_STYLE_TYPE.PARAGRAPH).name
+            if style_names[style_id].startswith('Heading'):
+                heading_styles.append(style_names[style_id])
         
         if not heading_styles:
             issues.append('✗ No heading styles used - use Word heading styles for accessibility (WCAG 1.3.1)')
@@ -228,16 +352,8 @@ class AccessibilityChecker:
     
     def _check_docx_images(self, doc: Any, issues: List, passes: List):
         """Check images for alt text"""
-        from docx.oxml.ns import nsdecls, qn
-        import xml.etree.ElementTree as ET
-        
-        total_images = 0
-        images_with_alt = 0
-        
         # Count images in document
-        for rel in doc.part.rels.values():
-            if "image" in rel.target_ref:
-                total_images += 1
+        total_images = sum(1 for rel in doc.part.rels.values() if "image" in rel.target_ref)
         
         # This is a simplified check - full implementation would parse XML for alt text
         if total_images == 0:
@@ -248,12 +364,9 @@ class AccessibilityChecker:
     
     def _check_docx_links(self, doc: Any, issues: List, passes: List):
         """Check hyperlinks"""
-        link_count = 0
-        
-        for para in doc.paragraphs:
-            for run in para.runs:
-                if run.element.find('.//w:hyperlink', {'w': 'http://schemas.openxmlformats.org/wordprocessingml/2006/main'}):
-                    link_count += 1
+        # One XPath count over the body instead of a Python loop over every
+        # run; a run counts when the first hyperlink inside it has content
+        link_count = int(doc.element.body.xpath('count(./w:p/w:r[(.//w:hyperlink)[1]/*])'))
         
         if link_count == 0:
             passes.append('✓ No hyperlinks to check')
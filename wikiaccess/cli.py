@@ -5,9 +5,11 @@ Provides command-line access to WikiAccess functionality.
 """
 
 import argparse
+import os
 import sys
 from pathlib import Path
-from .unified import convert_wiki_page, convert_multiple_pages
+
+from . import __version__
 
 
 def main():
@@ -47,14 +49,24 @@ def main():
         help='Skip accessibility checking'
     )
     
+    parser.add_argument(
+        '-j', '--jobs',
+        type=int,
+        default=max(1, (os.cpu_count() or 2) - 1),
+        help='Pages to convert in parallel (default: CPU count - 1; use 1 on slow disks)'
+    )
+    
     parser.add_argument(
         '--version',
         action='version',
-        version='WikiAccess 1.0.0'
+        version=f'WikiAccess {__version__}'
     )
     
     args = parser.parse_args()
     
+    # Deferred so --help/--version and argument errors don't load the converters
+    from .unified import convert_wiki_page, convert_multiple_pages
+    
     try:
         results = None
         result = None
@@ -81,7 +93,8 @@ def main():
                 page_names=args.pages,
                 output_dir=args.output,
                 formats=args.formats,
-                check_accessibility=not args.no_accessibility
+                check_accessibility=not args.no_accessibility,
+                jobs=args.jobs
             )
             
             for page_name, page_result in results.items():
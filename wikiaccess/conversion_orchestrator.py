@@ -13,6 +13,8 @@ orchestrator that coordinates between the various subsystems:
 This reduces unified.py from 752 lines to ~200 lines (framework code only).
 """
 
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime
@@ -66,9 +68,12 @@ class ConversionOrchestrator:
         self.link_stats = {}  # Store link statistics for reporting
 
         # Initialize components
-        client = DokuWikiHTTPClient(wiki_url)
-        self.converter = MarkdownConverter(client, str(self.output_dir), include_accessibility_toolbar=True)
-        self.accessibility_checker = AccessibilityChecker()
+        self.client = DokuWikiHTTPClient(wiki_url)
+        self.converter = MarkdownConverter(self.client, str(self.output_dir), include_accessibility_toolbar=True)
+        # pa11y results are reused for pages whose HTML hasn't changed
+        self.accessibility_checker = AccessibilityChecker(
+            cache_dir=str(self.output_dir / 'reports' / '.accessibility_cache')
+        )
         self.report_regenerator = ReportRegenerator(str(self.output_dir))
 
     def convert_pages(self, page_names: List[str],
@@ -76,7 +81,8 @@ class ConversionOrchestrator:
                       check_accessibility: bool = True,
                       enable_discovery: bool = True,
                       skip_recent: bool = True,
-                      batch_id: Optional[str] = None) -> Dict[str, Any]:
+                      batch_id: Optional[str] = None,
+                      jobs: int = 1) -> Dict[str, Any]:
         """Convert multiple pages with full pipeline.
 
         Args:
@@ -86,6 +92,7 @@ class ConversionOrchestrator:
             enable_discovery: Whether to auto-discover missing pages
             skip_recent: Whether to skip recently converted pages
             batch_id: Optional batch identifier. Auto-generated if not provided.
+            jobs: Number of pages to convert concurrently (1 = sequential)
 
         Returns:
             Dict with conversion results and statistics
@@ -116,10 +123,23 @@ class ConversionOrchestrator:
         print(f"{'='*70}\n")
 
         # Convert each page
-        for page_name in page_names:
-            result = self._convert_single_page(
-                page_name, formats, check_accessibility, batch_id, skip_recent
+        if jobs > 1:
+            page_results = self._convert_pages_parallel(
+                page_names, check_accessibility, batch_id, skip_recent, jobs
             )
+        else:
+            # Overlap the network fetches up front; conversion stays sequential
+            if len(page_names) > 1:
+                self.client.prefetch_pages([
+                    page_name for page_name in page_names
+                    if not (skip_recent and self.db and self.db.was_recently_converted(self.wiki_url, page_name))
+                ])
+            page_results = (
+                self._convert_single_page(page_name, formats, check_accessibility, batch_id, skip_recent)
+                for page_name in page_names
+            )
+
+        for page_name, result in zip(page_names, page_results):
             results[page_name] = result
 
             # Update statistics
@@ -181,85 +201,170 @@ class ConversionOrchestrator:
             return result
 
         try:
-            # Convert page
-            page_url = f"{self.wiki_url}/doku.php?id={page_name}"
-            html_path, docx_path, stats = self.converter.convert_url(page_url)
-
-            conversion_result = {
-                'html': {'file_path': html_path, 'stats': stats} if html_path else None,
-                'docx': {'file_path': docx_path, 'stats': stats} if docx_path else None,
-                'image_count': stats.get('images', 0),
-                'failed_images': stats.get('images_failed', 0)
-            }
-
-            result.update(conversion_result)
-
-            # Check accessibility if requested
-            if check_accessibility:
-                accessibility_results = {}
-
-                if html_path:
-                    html_accessibility = self.accessibility_checker.check_html(html_path)
-                    accessibility_results['html'] = html_accessibility
-
-                if docx_path:
-                    docx_accessibility = self.accessibility_checker.check_docx(docx_path)
-                    accessibility_results['docx'] = docx_accessibility
-
-                result['accessibility'] = accessibility_results
-
-                # Store accessibility data
-                if self.db:
-                    AccessibilityIssueHandler.store_and_update(
-                        self.db, page_name, batch_id, accessibility_results
-                    )
-
-            # Store in database
-            if self.db:
-                page_data = {
-                    'wiki_url': self.wiki_url,
-                    'page_id': page_name,
-                    'batch_id': batch_id,
-                    'conversion_status': 'SUCCESS',
-                    'markdown_path': str(self.output_dir / 'markdown' / f"{page_name.replace(':', '_')}.md"),
-                    'html_path': html_path,
-                    'docx_path': docx_path,
-                    'html_wcag_aa_score': result.get('accessibility', {}).get('html', {}).get('score_aa'),
-                    'html_wcag_aaa_score': result.get('accessibility', {}).get('html', {}).get('score_aaa'),
-                    'docx_wcag_aa_score': result.get('accessibility', {}).get('docx', {}).get('score_aa'),
-                    'docx_wcag_aaa_score': result.get('accessibility', {}).get('docx', {}).get('score_aaa'),
-                    'image_count': stats.get('images', 0),
-                    'image_success_count': stats.get('images_success', 0),
-                    'image_failed_count': stats.get('images_failed', 0),
-                    'conversion_duration_seconds': 0,
-                    'error_message': None
-                }
-                self.db.add_page_conversion(page_data)
-
-                # Store image details
-                for img in self.converter.image_details:
-                    if img.get('page_id') == page_name or not img.get('page_id'):
-                        img_data = {
-                            'page_id': page_name,
-                            'batch_id': batch_id,
-                            'type': img.get('type', 'wiki_image'),
-                            'source_url': img.get('source_url'),
-                            'local_filename': img.get('local_filename'),
-                            'status': img.get('status'),
-                            'file_size': img.get('file_size'),
-                            'dimensions': img.get('dimensions'),
-                            'alt_text': img.get('alt_text'),
-                            'alt_text_quality': 'missing' if not img.get('alt_text') else 'manual',
-                            'error_message': img.get('error_message')
-                        }
-                        self.db.add_image(img_data)
-
+            fields, stats = self._convert_page_files(
+                page_name, check_accessibility, self.converter, self.accessibility_checker
+            )
+            result.update(fields)
+            self._store_page_result(page_name, batch_id, result, stats, self.converter.image_details)
             return result
 
         except Exception as e:
             result['error'] = str(e)
             return result
 
+    def _convert_pages_parallel(self, page_names: List[str], check_accessibility: bool,
+                                batch_id: str, skip_recent: bool, jobs: int) -> List[Dict[str, Any]]:
+        """Convert pages on a thread pool, recording results on the calling thread.
+
+        Fetching, Pandoc and pa11y dominate each conversion and run outside
+        the GIL, so threads overlap them well. Every worker thread gets its
+        own MarkdownConverter because the converter keeps per-page state, while
+        the stateless AccessibilityChecker is shared; database access stays on
+        the calling thread since the SQLite connection must not be shared
+        between threads.
+
+        Args:
+            page_names: Page names to convert
+            check_accessibility: Whether to check accessibility
+            batch_id: Batch identifier
+            skip_recent: Whether to skip recently converted pages
+            jobs: Number of worker threads
+
+        Returns:
+            Conversion result dicts, in the same order as page_names
+        """
+        worker = threading.local()
+
+        def convert(page_name):
+            if not hasattr(worker, 'converter'):
+                # Workers share self.client so they reuse its pooled keep-alive connections
+                worker.converter = MarkdownConverter(
+                    self.client, str(self.output_dir),
+                    include_accessibility_toolbar=True
+                )
+            worker.converter.image_details = []
+            fields, stats = self._convert_page_files(
+                page_name, check_accessibility, worker.converter, self.accessibility_checker
+            )
+            return fields, stats, worker.converter.image_details
+
+        results = []
+        with ThreadPoolExecutor(max_workers=jobs) as executor:
+            futures = {}
+            for page_name in page_names:
+                if skip_recent and self.db and self.db.was_recently_converted(self.wiki_url, page_name):
+                    continue
+                futures[page_name] = executor.submit(convert, page_name)
+
+            for page_name in page_names:
+                result = {'page_name': page_name}
+                future = futures.get(page_name)
+                if future is None:
+                    result['skipped'] = True
+                else:
+                    try:
+                        fields, stats, image_details = future.result()
+                        result.update(fields)
+                        self._store_page_result(page_name, batch_id, result, stats, image_details)
+                    except Exception as e:
+                        result['error'] = str(e)
+                results.append(result)
+
+        return results
+
+    def _convert_page_files(self, page_name: str, check_accessibility: bool,
+                            converter: MarkdownConverter,
+                            checker: AccessibilityChecker) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """Fetch, convert and check one page without touching the database.
+
+        Args:
+            page_name: Page name to convert
+            check_accessibility: Whether to check accessibility
+            converter: Converter used to produce the HTML/DOCX files
+            checker: Accessibility checker for the produced files
+
+        Returns:
+            Tuple of (result fields, converter stats)
+        """
+        page_url = f"{self.wiki_url}/doku.php?id={page_name}"
+        html_path, docx_path, stats = converter.convert_url(page_url)
+
+        fields = {
+            'html': {'file_path': html_path, 'stats': stats} if html_path else None,
+            'docx': {'file_path': docx_path, 'stats': stats} if docx_path else None,
+            'image_count': stats.get('images', 0),
+            'failed_images': stats.get('images_failed', 0)
+        }
+
+        # Check accessibility if requested
+        if check_accessibility:
+            fields['accessibility'] = checker.check_documents(html_path, docx_path)
+
+        return fields, stats
+
+    def _store_page_result(self, page_name: str, batch_id: str, result: Dict[str, Any],
+                           stats: Dict[str, Any], image_details: List[Dict]) -> None:
+        """Record a converted page, its accessibility data and images.
+
+        Args:
+            page_name: Page name that was converted
+            batch_id: Batch identifier
+            result: Conversion result dict (from _convert_page_files)
+            stats: Converter stats for the page
+            image_details: Image records collected by the converter
+        """
+        if not self.db:
+            return
+
+        accessibility = result.get('accessibility')
+        if accessibility is not None:
+            AccessibilityIssueHandler.store_and_update(
+                self.db, page_name, batch_id, accessibility
+            )
+
+        html_path = (result.get('html') or {}).get('file_path')
+        docx_path = (result.get('docx') or {}).get('file_path')
+        page_data = {
+            'wiki_url': self.wiki_url,
+            'page_id': page_name,
+            'batch_id': batch_id,
+            'conversion_status': 'SUCCESS',
+            'markdown_path': str(self.output_dir / 'markdown' / f"{page_name.replace(':', '_')}.md"),
+            'html_path': html_path,
+            'docx_path': docx_path,
+            'html_wcag_aa_score': (accessibility or {}).get('html', {}).get('score_aa'),
+            'html_wcag_aaa_score': (accessibility or {}).get('html', {}).get('score_aaa'),
+            'docx_wcag_aa_score': (accessibility or {}).get('docx', {}).get('score_aa'),
+            'docx_wcag_aaa_score': (accessibility or {}).get('docx', {}).get('score_aaa'),
+            'image_count': stats.get('images', 0),
+            'image_success_count': stats.get('images_success', 0),
+            'image_failed_count': stats.get('images_failed', 0),
+            'conversion_duration_seconds': 0,
+            'error_message': None
+        }
+        # Page and image rows are committed together
+        with self.db.transaction():
+            self.db.add_page_conversion(page_data)
+
+            # Store image details
+            self.db.add_images([
+                {
+                    'page_id': page_name,
+                    'batch_id': batch_id,
+                    'type': img.get('type', 'wiki_image'),
+                    'source_url': img.get('source_url'),
+                    'local_filename': img.get('local_filename'),
+                    'status': img.get('status'),
+                    'file_size': img.get('file_size'),
+                    'dimensions': img.get('dimensions'),
+                    'alt_text': img.get('alt_text'),
+                    'alt_text_quality': 'missing' if not img.get('alt_text') else 'manual',
+                    'error_message': img.get('error_message')
+                }
+                for img in image_details
+                if img.get('page_id') == page_name or not img.get('page_id')
+            ])
+
     def _generate_reports(self, batch_id: str, results: Dict[str, Any]) -> None:
         """Generate conversion reports for batch.
 
@@ -12,32 +12,145 @@ This module provides persistent storage for:
 import sqlite3
 import json
 from pathlib import Path
-from typing import Optional, Dict, List, Any, Tuple
+from typing import Optional, Dict, List, Any, Tuple, Iterator
 from datetime import datetime
 import contextlib
 
 
+# Shared by add_image() and add_images() so both reuse one cached statement
+_INSERT_IMAGE_SQL = """
+    INSERT INTO images (
+        page_id, batch_id, type, source_url, local_filename,
+        status, file_size, dimensions, alt_text, alt_text_quality,
+        error_message
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+
+def _image_params(image_data: Dict[str, Any]) -> tuple:
+    """Order an image dict's values for _INSERT_IMAGE_SQL."""
+    return (
+        image_data.get('page_id'),
+        image_data.get('batch_id'),
+        image_data.get('type'),
+        image_data.get('source_url'),
+        image_data.get('local_filename'),
+        image_data.get('status'),
+        image_data.get('file_size'),
+        image_data.get('dimensions'),
+        image_data.get('alt_text'),
+        image_data.get('alt_text_quality'),
+        image_data.get('error_message')
+    )
+
+
+# Shared by add_link() and add_links()
+_INSERT_LINK_SQL = """
+    INSERT INTO links (
+        source_page_id, target_page_id, link_text,
+        link_type, resolution_status, batch_id
+    ) VALUES (?, ?, ?, ?, ?, ?)
+"""
+
+
+def _link_params(link_data: Dict[str, Any]) -> tuple:
+    """Order a link dict's values for _INSERT_LINK_SQL."""
+    return (
+        link_data.get('source_page_id'),
+        link_data.get('target_page_id'),
+        link_data.get('link_text'),
+        link_data.get('link_type'),
+        link_data.get('resolution_status'),
+        link_data.get('batch_id')
+    )
+
+
+# Shared by add_accessibility_issue() and add_accessibility_issues()
+_INSERT_ACCESSIBILITY_ISSUE_SQL = """
+    INSERT INTO accessibility_issues (
+        page_id, batch_id, format, level,
+        issue_code, issue_message, element_selector
+    ) VALUES (?, ?, ?, ?, ?, ?, ?)
+"""
+
+
+def _accessibility_issue_params(issue_data: Dict[str, Any]) -> tuple:
+    """Order an issue dict's values for _INSERT_ACCESSIBILITY_ISSUE_SQL."""
+    return (
+        issue_data.get('page_id'),
+        issue_data.get('batch_id'),
+        issue_data.get('format'),
+        issue_data.get('level'),
+        issue_data.get('issue_code'),
+        issue_data.get('issue_message'),
+        issue_data.get('element_selector')
+    )
+
+
 class ConversionDatabase:
     """Manages SQLite database for conversion tracking."""
 
-    def __init__(self, db_path: str = "output/conversion_history.db"):
+    def __init__(self, db_path: str = "output/conversion_history.db", tuned: bool = True,
+                 read_only: bool = False):
         """Initialize database connection and create schema if needed.
 
         Args:
-            db_path: Path to SQLite database file. Defaults to output/conversion_history.db
+            db_path: Path to SQLite database file. Defaults to output/conversion_history.db.
+                ':memory:' gives a throwaway in-memory database with no disk I/O,
+                which is what quick checks and tests should use.
+            tuned: Apply the WAL/cache performance pragmas. Pass False to keep
+                SQLite's default rollback-journal behaviour.
+            read_only: Open an existing database with mode=ro and query_only,
+                skipping schema creation. For scripts that only read.
+
+        Raises:
+            ValueError: If read_only is combined with ':memory:'
         """
+        if read_only and str(db_path) == ':memory:':
+            raise ValueError("read_only needs an existing database file, not ':memory:'")
         self.db_path = Path(db_path)
-        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.tuned = tuned
+        self.read_only = read_only
         self.conn = None
+        self._broken_links_cache = None
+        self._transaction_depth = 0
+        if read_only:
+            self._connect()
+            return
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
         self._connect()
         self._create_schema()
 
     def _connect(self):
         """Establish database connection."""
-        self.conn = sqlite3.connect(str(self.db_path))
+        # Larger prepared-statement cache: a full run issues about as many
+        # distinct statements as the default 128-entry cache holds
+        if self.read_only:
+            # mode=ro fails instead of creating a missing file. immutable=1 is
+            # deliberately not used: it would ignore pages still in the WAL.
+            self.conn = sqlite3.connect(f"{self.db_path.resolve().as_uri()}?mode=ro",
+                                        uri=True, cached_statements=256)
+        else:
+            self.conn = sqlite3.connect(str(self.db_path), cached_statements=256)
         self.conn.row_factory = sqlite3.Row  # Enable dict-like access
         # Enable foreign keys
         self.conn.execute("PRAGMA foreign_keys = ON")
+        # Wait for a concurrent script's write lock instead of failing at once
+        self.conn.execute("PRAGMA busy_timeout = 30000")
+        if self.read_only:
+            self.conn.execute("PRAGMA query_only = ON")
+        if not self.tuned:
+            return
+        if not self.read_only:
+            # WAL lets report readers run alongside a converting writer, and
+            # NORMAL sync is durable under WAL without an fsync per commit
+            self.conn.execute("PRAGMA journal_mode = WAL")
+            self.conn.execute("PRAGMA synchronous = NORMAL")
+        # 64 MB page cache (negative value is in KiB), 256 MB memory map,
+        # and in-memory temp tables for the report sorts
+        self.conn.execute("PRAGMA cache_size = -65536")
+        self.conn.execute("PRAGMA mmap_size = 268435456")
+        self.conn.execute("PRAGMA temp_store = MEMORY")
 
     def _create_schema(self):
         """Create database schema if it doesn't exist."""
@@ -82,15 +195,30 @@ class ConversionDatabase:
                 )
             """)
 
-            # Create index for efficient queries
+            # Create index for efficient queries; conversion_status is included
+            # so was_recently_converted() is answered from the index alone.
+            # Supersedes the older idx_pages_lookup without that column.
+            self.conn.execute("DROP INDEX IF EXISTS idx_pages_lookup")
+            self.conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_pages_recency
+                ON pages(wiki_url, page_id, converted_at DESC, conversion_status)
+            """)
+
+            # Batch/status filters (get_failed_pages, get_converted_pages,
+            # get_all_page_ids). Trailing page_id makes them index-only;
+            # supersedes the older batch indexes without it
+            self.conn.execute("DROP INDEX IF EXISTS idx_pages_batch")
+            self.conn.execute("DROP INDEX IF EXISTS idx_pages_batch_status")
+            self.conn.execute("DROP INDEX IF EXISTS idx_pages_batch_page")
             self.conn.execute("""
-                CREATE INDEX IF NOT EXISTS idx_pages_lookup
-                ON pages(wiki_url, page_id, converted_at DESC)
+                CREATE INDEX IF NOT EXISTS idx_pages_batch_status_page
+                ON pages(batch_id, conversion_status, page_id)
             """)
 
+            # Per-page history lookups (WHERE page_id = ? ORDER BY converted_at DESC)
             self.conn.execute("""
-                CREATE INDEX IF NOT EXISTS idx_pages_batch
-                ON pages(batch_id, conversion_status)
+                CREATE INDEX IF NOT EXISTS idx_pages_history
+                ON pages(page_id, converted_at DESC)
             """)
 
             # Images table
@@ -122,6 +250,11 @@ class ConversionDatabase:
                 ON images(status, source_url)
             """)
 
+            self.conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_images_page_order
+                ON images(page_id, id)
+            """)
+
             # Links table
             self.conn.execute("""
                 CREATE TABLE IF NOT EXISTS links (
@@ -146,6 +279,24 @@ class ConversionDatabase:
                 ON links(target_page_id, resolution_status)
             """)
 
+            # Covering index for outgoing-link listings per page
+            self.conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_links_outgoing
+                ON links(source_page_id, link_type, target_page_id, resolution_status)
+            """)
+
+            self.conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_links_incoming
+                ON links(target_page_id, link_type)
+            """)
+
+            # Covering index for the broken-link reports (resolution_status =
+            # 'missing' AND link_type = 'internal', grouped by target)
+            self.conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_links_missing
+                ON links(resolution_status, link_type, target_page_id, source_page_id)
+            """)
+
             # Accessibility issues table
             self.conn.execute("""
                 CREATE TABLE IF NOT EXISTS accessibility_issues (
@@ -258,13 +409,40 @@ class ConversionDatabase:
 
     @contextlib.contextmanager
     def transaction(self):
-        """Context manager for database transactions."""
+        """Context manager for database transactions.
+
+        Transactions nest: only the outermost block commits or rolls back, so
+        a caller can group several add_* calls into a single commit. Inner
+        blocks run under a SAVEPOINT, so an inner block that raises undoes
+        only its own writes even if the caller catches the exception and the
+        outer block goes on to commit.
+        """
+        depth = self._transaction_depth
+        savepoint = None
+        if depth > 0:
+            # A SAVEPOINT outside a transaction would start (and on RELEASE
+            # commit) one of its own, so make sure the outer one is open
+            if not self.conn.in_transaction:
+                self.conn.execute("BEGIN")
+            savepoint = f"nested_{depth}"
+            self.conn.execute(f"SAVEPOINT {savepoint}")
+
+        self._transaction_depth += 1
         try:
             yield self.conn
-            self.conn.commit()
+            if savepoint:
+                self.conn.execute(f"RELEASE SAVEPOINT {savepoint}")
+            else:
+                self.conn.commit()
         except Exception as e:
-            self.conn.rollback()
+            if savepoint:
+                self.conn.execute(f"ROLLBACK TO SAVEPOINT {savepoint}")
+                self.conn.execute(f"RELEASE SAVEPOINT {savepoint}")
+            else:
+                self.conn.rollback()
             raise e
+        finally:
+            self._transaction_depth -= 1
 
     # Batch operations
 
@@ -395,12 +573,13 @@ class ConversionDatabase:
             True if page was converted successfully within the time window
         """
         cursor = self.conn.execute("""
-            SELECT COUNT(*) FROM pages
+            SELECT 1 FROM pages
             WHERE wiki_url = ? AND page_id = ?
             AND conversion_status = 'SUCCESS'
             AND converted_at > datetime('now', '-' || ? || ' hours')
+            LIMIT 1
         """, (wiki_url, page_id, hours))
-        return cursor.fetchone()[0] > 0
+        return cursor.fetchone() is not None
 
     def get_failed_pages(self, batch_id: str) -> List[str]:
         """Get list of page IDs that failed conversion in a batch.
@@ -430,7 +609,7 @@ class ConversionDatabase:
             SELECT page_id FROM pages
             WHERE batch_id = ? AND conversion_status = 'SUCCESS'
         """, (batch_id,))
-        return [row[0] for row in cursor.fetchall()]
+        return [row[0] for row in cursor]
 
     # Image operations
 
@@ -444,27 +623,22 @@ class ConversionDatabase:
             Row ID of inserted image record
         """
         with self.transaction():
-            cursor = self.conn.execute("""
-                INSERT INTO images (
-                    page_id, batch_id, type, source_url, local_filename,
-                    status, file_size, dimensions, alt_text, alt_text_quality,
-                    error_message
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                image_data.get('page_id'),
-                image_data.get('batch_id'),
-                image_data.get('type'),
-                image_data.get('source_url'),
-                image_data.get('local_filename'),
-                image_data.get('status'),
-                image_data.get('file_size'),
-                image_data.get('dimensions'),
-                image_data.get('alt_text'),
-                image_data.get('alt_text_quality'),
-                image_data.get('error_message')
-            ))
+            cursor = self.conn.execute(_INSERT_IMAGE_SQL, _image_params(image_data))
             return cursor.lastrowid
 
+    def add_images(self, images: List[Dict[str, Any]]) -> int:
+        """Record several image download attempts with one executemany.
+
+        Args:
+            images: Image detail dicts, as accepted by add_image()
+
+        Returns:
+            Number of image records inserted
+        """
+        with self.transaction():
+            cursor = self.conn.executemany(_INSERT_IMAGE_SQL, map(_image_params, images))
+            return cursor.rowcount
+
     def get_failed_images(self, batch_id: Optional[str] = None) -> List[Dict[str, Any]]:
         """Get list of images that failed to download.
 
@@ -519,21 +693,22 @@ class ConversionDatabase:
             Row ID of inserted link record
         """
         with self.transaction():
-            cursor = self.conn.execute("""
-                INSERT INTO links (
-                    source_page_id, target_page_id, link_text,
-                    link_type, resolution_status, batch_id
-                ) VALUES (?, ?, ?, ?, ?, ?)
-            """, (
-                link_data.get('source_page_id'),
-                link_data.get('target_page_id'),
-                link_data.get('link_text'),
-                link_data.get('link_type'),
-                link_data.get('resolution_status'),
-                link_data.get('batch_id')
-            ))
+            cursor = self.conn.execute(_INSERT_LINK_SQL, _link_params(link_data))
             return cursor.lastrowid
 
+    def add_links(self, links: List[Dict[str, Any]]) -> int:
+        """Record several links with one executemany in a single transaction.
+
+        Args:
+            links: Link detail dicts, as accepted by add_link()
+
+        Returns:
+            Number of link records inserted
+        """
+        with self.transaction():
+            cursor = self.conn.executemany(_INSERT_LINK_SQL, map(_link_params, links))
+            return cursor.rowcount
+
     def get_broken_links(self, batch_id: str) -> List[Dict[str, Any]]:
         """Get all broken (missing) internal links for a batch.
 
@@ -557,12 +732,29 @@ class ConversionDatabase:
         """, (batch_id,))
         return [dict(row) for row in cursor.fetchall()]
 
+    def _data_version(self) -> tuple:
+        """Key that changes whenever the database may have been modified.
+
+        total_changes counts writes made on this connection and
+        PRAGMA data_version changes when another connection commits.
+        """
+        data_version = self.conn.execute("PRAGMA data_version").fetchone()[0]
+        return (self.conn.total_changes, data_version)
+
     def get_all_broken_links(self) -> List[Dict[str, Any]]:
         """Get all broken (missing) internal links across all batches.
 
+        The aggregate is cached until the database changes, so repeated calls
+        within one run (e.g. link stats and the broken links report) scan the
+        links table once.
+
         Returns:
             List of broken link records from all batches
         """
+        version = self._data_version()
+        if self._broken_links_cache is not None and self._broken_links_cache[0] == version:
+            return [dict(link) for link in self._broken_links_cache[1]]
+
         cursor = self.conn.execute("""
             SELECT
                 target_page_id,
@@ -574,33 +766,80 @@ class ConversionDatabase:
             GROUP BY target_page_id
             ORDER BY reference_count DESC
         """)
+        links = [dict(row) for row in cursor.fetchall()]
+        self._broken_links_cache = (version, links)
+        return [dict(link) for link in links]
+
+    def get_top_broken_links(self, limit: int = 10) -> List[Dict[str, Any]]:
+        """Get the most-referenced missing internal link targets.
+
+        Sorting and limiting happen in SQLite, so only `limit` rows are built.
+
+        Args:
+            limit: Maximum number of targets to return
+
+        Returns:
+            List of dicts with target_page_id and reference_count, most referenced first
+        """
+        cursor = self.conn.execute("""
+            SELECT target_page_id, COUNT(*) as reference_count
+            FROM links
+            WHERE link_type = 'internal'
+            AND resolution_status = 'missing'
+            GROUP BY target_page_id
+            ORDER BY reference_count DESC
+            LIMIT ?
+        """, (limit,))
         return [dict(row) for row in cursor.fetchall()]
 
+    def get_broken_link_summary(self) -> Dict[str, int]:
+        """Count broken internal links without fetching them.
+
+        Returns:
+            Dict with 'targets' (unique missing pages) and 'references'
+            (total missing-link rows)
+        """
+        row = self.conn.execute("""
+            SELECT COUNT(DISTINCT target_page_id) as targets, COUNT(*) as refs
+            FROM links
+            WHERE link_type = 'internal'
+            AND resolution_status = 'missing'
+        """).fetchone()
+        return {'targets': row['targets'], 'references': row['refs']}
+
     def resolve_converted_links(self) -> int:
         """Mark broken links as 'found' if their target pages have been converted.
 
         This updates links that were marked as 'missing' but now point to converted pages.
+        The single set-based UPDATE runs in one IMMEDIATE transaction, so the write
+        lock is taken up front instead of being upgraded mid-statement.
 
         Returns:
             Number of links that were updated
         """
-        cursor = self.conn.execute("""
-            UPDATE links
-            SET resolution_status = 'found'
-            WHERE resolution_status = 'missing'
-            AND link_type = 'internal'
-            AND target_page_id IN (SELECT page_id FROM pages)
-        """)
-        self.conn.commit()
+        with self.transaction():
+            if not self.conn.in_transaction:
+                self.conn.execute("BEGIN IMMEDIATE")
+            cursor = self.conn.execute("""
+                UPDATE links
+                SET resolution_status = 'found'
+                WHERE resolution_status = 'missing'
+                AND link_type = 'internal'
+                AND target_page_id IN (SELECT page_id FROM pages)
+            """)
         return cursor.rowcount
 
     # Report Generation - Abstracted Queries
 
-    def get_all_pages_with_scores(self) -> List[Dict[str, Any]]:
+    def get_all_pages_with_scores(self) -> List[sqlite3.Row]:
         """Get all pages with accessibility scores for report generation.
 
+        Rows are returned as sqlite3.Row objects (read-only, indexed by column
+        name) rather than copied into dicts, since report builders only read
+        them once to build their own structures.
+
         Returns:
-            List of dicts with page_id, html_wcag_aa_score, html_wcag_aaa_score,
+            List of rows with page_id, html_wcag_aa_score, html_wcag_aaa_score,
                         docx_wcag_aa_score, docx_wcag_aaa_score
         """
         cursor = self.conn.execute("""
@@ -609,13 +848,66 @@ class ConversionDatabase:
             FROM pages
             ORDER BY page_id
         """)
-        return [dict(row) for row in cursor.fetchall()]
+        return cursor.fetchall()
+
+    def iter_pages_with_scores(self, batch_size: int = 500) -> Iterator[sqlite3.Row]:
+        """Stream each page's latest scores in fetchmany batches.
 
-    def get_all_images_for_report(self) -> List[Dict[str, Any]]:
+        Unlike get_all_pages_with_scores(), which returns every conversion of
+        every page, only the most recent conversion per page is returned, so
+        report builders see each page once.
+
+        Args:
+            batch_size: Rows fetched from SQLite per round trip
+
+        Yields:
+            Rows with page_id, display_name (page_id with ':' replaced by '_',
+            as used for report file names) and the four WCAG score columns,
+            ordered by page_id
+        """
+        cursor = self.conn.execute("""
+            SELECT page_id, REPLACE(page_id, ':', '_') AS display_name,
+                   html_wcag_aa_score, html_wcag_aaa_score,
+                   docx_wcag_aa_score, docx_wcag_aaa_score
+            FROM (
+                SELECT page_id, html_wcag_aa_score, html_wcag_aaa_score,
+                       docx_wcag_aa_score, docx_wcag_aaa_score,
+                       ROW_NUMBER() OVER (PARTITION BY page_id ORDER BY converted_at DESC, id DESC) AS rn
+                FROM pages
+            )
+            WHERE rn = 1
+            ORDER BY page_id
+        """)
+        while True:
+            rows = cursor.fetchmany(batch_size)
+            if not rows:
+                break
+            yield from rows
+
+    def get_report_counts(self) -> Dict[str, int]:
+        """Count the rows behind the reports without fetching them.
+
+        Returns:
+            Dict with 'pages' (rows of get_all_pages_with_scores()), 'images'
+            (rows of get_all_images_for_report()) and 'broken_links' (rows of
+            get_all_broken_links())
+        """
+        row = self.conn.execute("""
+            SELECT
+                (SELECT COUNT(*) FROM pages) as pages,
+                (SELECT COUNT(*) FROM images) as images,
+                (SELECT COUNT(DISTINCT target_page_id) FROM links
+                 WHERE link_type = 'internal' AND resolution_status = 'missing') as broken_links
+        """).fetchone()
+        return dict(row)
+
+    def get_all_images_for_report(self) -> List[sqlite3.Row]:
         """Get all images with metadata for comprehensive image report.
 
+        Like get_all_pages_with_scores, returns sqlite3.Row objects.
+
         Returns:
-            List of dicts with complete image information
+            List of rows with complete image information
         """
         cursor = self.conn.execute("""
             SELECT page_id, type, source_url, local_filename, status,
@@ -623,7 +915,28 @@ class ConversionDatabase:
             FROM images
             ORDER BY downloaded_at DESC
         """)
-        return [dict(row) for row in cursor.fetchall()]
+        return cursor.fetchall()
+
+    def iter_images_for_report(self, batch_size: int = 1000) -> Iterator[sqlite3.Row]:
+        """Stream the rows of get_all_images_for_report() in fetchmany batches.
+
+        Args:
+            batch_size: Rows fetched from SQLite per round trip
+
+        Yields:
+            Rows with complete image information, newest download first
+        """
+        cursor = self.conn.execute("""
+            SELECT page_id, type, source_url, local_filename, status,
+                   file_size, dimensions, alt_text, error_message, downloaded_at
+            FROM images
+            ORDER BY downloaded_at DESC
+        """)
+        while True:
+            rows = cursor.fetchmany(batch_size)
+            if not rows:
+                break
+            yield from rows
 
     def get_pages_with_broken_links(self) -> List[str]:
         """Get list of all pages that have broken links.
@@ -655,6 +968,7 @@ class ConversionDatabase:
             accessibility_results: Dict with 'html' and 'docx' keys, each containing
                                  'score_aa', 'score_aaa', 'issues_aa', 'issues_aaa'
         """
+        issue_rows = []
         for format_type in ['html', 'docx']:
             if format_type not in accessibility_results:
                 continue
@@ -669,7 +983,7 @@ class ConversionDatabase:
 
                 for issue in issues:
                     if isinstance(issue, dict):
-                        issue_data = {
+                        issue_rows.append({
                             'page_id': page_id,
                             'batch_id': batch_id,
                             'format': format_upper,
@@ -677,10 +991,10 @@ class ConversionDatabase:
                             'issue_code': issue.get('code', 'unknown'),
                             'issue_message': issue.get('message', ''),
                             'element_selector': issue.get('selector', '')
-                        }
+                        })
                     else:
                         # Issue is a string
-                        issue_data = {
+                        issue_rows.append({
                             'page_id': page_id,
                             'batch_id': batch_id,
                             'format': format_upper,
@@ -688,8 +1002,12 @@ class ConversionDatabase:
                             'issue_code': 'unknown',
                             'issue_message': str(issue),
                             'element_selector': ''
-                        }
-                    self.add_accessibility_issue(issue_data)
+                        })
+
+        # One executemany (and one commit) for all of the page's issues,
+        # rather than a savepoint per row
+        if issue_rows:
+            self.add_accessibility_issues(issue_rows)
 
     def get_page_links(self, page_id: str, batch_id: str) -> List[Dict[str, Any]]:
         """Get all links from a specific page.
@@ -720,22 +1038,24 @@ class ConversionDatabase:
             Row ID of inserted issue record
         """
         with self.transaction():
-            cursor = self.conn.execute("""
-                INSERT INTO accessibility_issues (
-                    page_id, batch_id, format, level,
-                    issue_code, issue_message, element_selector
-                ) VALUES (?, ?, ?, ?, ?, ?, ?)
-            """, (
-                issue_data.get('page_id'),
-                issue_data.get('batch_id'),
-                issue_data.get('format'),
-                issue_data.get('level'),
-                issue_data.get('issue_code'),
-                issue_data.get('issue_message'),
-                issue_data.get('element_selector')
-            ))
+            cursor = self.conn.execute(_INSERT_ACCESSIBILITY_ISSUE_SQL,
+                                       _accessibility_issue_params(issue_data))
             return cursor.lastrowid
 
+    def add_accessibility_issues(self, issues: List[Dict[str, Any]]) -> int:
+        """Record several accessibility issues with one executemany.
+
+        Args:
+            issues: Issue detail dicts, as accepted by add_accessibility_issue()
+
+        Returns:
+            Number of issue records inserted
+        """
+        with self.transaction():
+            cursor = self.conn.executemany(_INSERT_ACCESSIBILITY_ISSUE_SQL,
+                                           map(_accessibility_issue_params, issues))
+            return cursor.rowcount
+
     def get_accessibility_trends(self, wiki_url: str, page_id: str) -> List[Dict[str, Any]]:
         """Get accessibility score trends for a page over time.
 
@@ -843,6 +1163,36 @@ class ConversionDatabase:
         cursor = self.conn.execute(query, params)
         return [dict(row) for row in cursor.fetchall()]
 
+    def iter_discovered_page_ids(self, status: Optional[str] = None) -> Iterator[str]:
+        """Stream discovered page IDs without materializing the full records.
+
+        Yields in the same order as get_discovered_pages().
+
+        Args:
+            status: Filter by discovery_status
+
+        Yields:
+            Target page identifiers
+        """
+        query = "SELECT target_page_id FROM discovered_pages"
+        params = []
+        if status:
+            query += " WHERE discovery_status = ?"
+            params.append(status)
+        query += " ORDER BY reference_count DESC, first_discovered_at ASC"
+
+        # Plain tuples fetched in blocks; no sqlite3.Row per page id
+        cursor = self.conn.cursor()
+        cursor.row_factory = None
+        cursor.arraysize = 1000
+        cursor.execute(query, params)
+        while True:
+            rows = cursor.fetchmany()
+            if not rows:
+                break
+            for (page_id,) in rows:
+                yield page_id
+
     def is_page_discovered(self, page_id: str) -> Optional[Dict[str, Any]]:
         """Check if a page has been discovered.
 
@@ -858,6 +1208,31 @@ class ConversionDatabase:
         row = cursor.fetchone()
         return dict(row) if row else None
 
+    def get_discovery_statuses(self, page_ids: List[str]) -> Dict[str, str]:
+        """Look up the discovery status of several pages at once.
+
+        Replaces one is_page_discovered() query per page with chunked
+        ``IN (...)`` lookups.
+
+        Args:
+            page_ids: Target page identifiers
+
+        Returns:
+            Dict of {target_page_id: discovery_status}; pages that haven't
+            been discovered are absent
+        """
+        statuses = {}
+        # Stay below SQLite's default SQLITE_MAX_VARIABLE_NUMBER (999)
+        for start in range(0, len(page_ids), 500):
+            chunk = page_ids[start:start + 500]
+            placeholders = ','.join('?' * len(chunk))
+            cursor = self.conn.execute(f"""
+                SELECT target_page_id, discovery_status FROM discovered_pages
+                WHERE target_page_id IN ({placeholders})
+            """, chunk)
+            statuses.update((row[0], row[1]) for row in cursor)
+        return statuses
+
     def update_discovery_status(self, page_id: str, new_status: str,
                                reason: Optional[str] = None,
                                http_status: Optional[int] = None) -> None:
@@ -905,6 +1280,42 @@ class ConversionDatabase:
                 WHERE target_page_id = ?
             """, (batch_id, page_id))
 
+    def bulk_mark_discovered_as_converted(self, page_ids: List[str], batch_id: str) -> List[str]:
+        """Mark several discovered pages as converted in a single transaction.
+
+        Updates are issued as chunked ``WHERE target_page_id IN (...)``
+        statements, so the number of statements grows with the chunk count
+        rather than the page count.
+
+        Args:
+            page_ids: Page identifiers that converted successfully
+            batch_id: Batch identifier where conversion occurred
+
+        Returns:
+            Page IDs that were found and updated; IDs missing from the
+            result have no discovered_pages row
+        """
+        updated = []
+        with self.transaction():
+            # Stay below SQLite's default SQLITE_MAX_VARIABLE_NUMBER (999)
+            for start in range(0, len(page_ids), 500):
+                chunk = page_ids[start:start + 500]
+                placeholders = ','.join('?' * len(chunk))
+                self.conn.execute(f"""
+                    UPDATE discovered_pages
+                    SET discovery_status = 'converted',
+                        converted_at = CURRENT_TIMESTAMP,
+                        converted_batch_id = ?
+                    WHERE target_page_id IN ({placeholders})
+                """, [batch_id, *chunk])
+                cursor = self.conn.execute(f"""
+                    SELECT target_page_id FROM discovered_pages
+                    WHERE converted_batch_id = ? AND target_page_id IN ({placeholders})
+                """, [batch_id, *chunk])
+                updated.extend(row[0] for row in cursor)
+
+        return updated
+
     def get_discovery_sources(self, discovered_page_id: int) -> List[Dict[str, Any]]:
         """Get all source pages for a discovered page.
 
@@ -942,6 +1353,25 @@ class ConversionDatabase:
         cursor = self.conn.execute(query, params)
         return [row[0] for row in cursor.fetchall()]
 
+    def get_max_approved_depth(self, max_depth: Optional[int] = None) -> int:
+        """Get the deepest discovery depth among approved pages.
+
+        Args:
+            max_depth: Optional maximum discovery depth to include, matching
+                get_approved_pages_for_conversion()
+
+        Returns:
+            Maximum discovery_depth of the approved pages, or 0 if there are none
+        """
+        query = "SELECT COALESCE(MAX(discovery_depth), 0) FROM discovered_pages WHERE discovery_status = 'approved'"
+        params = []
+
+        if max_depth is not None:
+            query += " AND discovery_depth <= ?"
+            params.append(max_depth)
+
+        return self.conn.execute(query, params).fetchone()[0]
+
     def get_discovery_statistics(self) -> Dict[str, int]:
         """Get counts for each discovery status.
 
@@ -1142,25 +1572,22 @@ class ConversionDatabase:
         Returns:
             Dict with totals, status breakdown, depth breakdown
         """
-        total_cursor = self.conn.execute("""
-            SELECT COUNT(*) FROM discovered_pages
-        """)
-        total = total_cursor.fetchone()[0]
-
-        status_cursor = self.conn.execute("""
-            SELECT discovery_status, COUNT(*) as count
+        # One pass over the (discovery_status, discovery_depth) index; the
+        # total and both breakdowns are rolled up from the grouped rows
+        cursor = self.conn.execute("""
+            SELECT discovery_status, discovery_depth, COUNT(*) as count
             FROM discovered_pages
-            GROUP BY discovery_status
+            GROUP BY discovery_status, discovery_depth
         """)
-        status_counts = {row[0]: row[1] for row in status_cursor.fetchall()}
+        total = 0
+        status_counts = {}
+        depth_totals = {}
+        for status, depth, count in cursor.fetchall():
+            total += count
+            status_counts[status] = status_counts.get(status, 0) + count
+            depth_totals[depth] = depth_totals.get(depth, 0) + count
 
-        depth_cursor = self.conn.execute("""
-            SELECT discovery_depth, COUNT(*) as count
-            FROM discovered_pages
-            GROUP BY discovery_depth
-            ORDER BY discovery_depth
-        """)
-        depth_counts = {row[0]: row[1] for row in depth_cursor.fetchall()}
+        depth_counts = {depth: depth_totals[depth] for depth in sorted(depth_totals)}
 
         return {
             'total_discovered': total,
@@ -1177,13 +1604,13 @@ class ConversionDatabase:
             batch_id: Batch identifier
             pages_discovered: Number of new discoveries
         """
-        self.conn.execute("""
-            UPDATE conversion_batches
-            SET pages_discovered_count = ?,
-                discovery_enabled = 1
-            WHERE batch_id = ?
-        """, (pages_discovered, batch_id))
-        self.conn.commit()
+        with self.transaction():
+            self.conn.execute("""
+                UPDATE conversion_batches
+                SET pages_discovered_count = ?,
+                    discovery_enabled = 1
+                WHERE batch_id = ?
+            """, (pages_discovered, batch_id))
 
     # Accessibility operations
 
@@ -1199,15 +1626,15 @@ class ConversionDatabase:
             docx_aa: DOCX WCAG AA score
             docx_aaa: DOCX WCAG AAA score
         """
-        self.conn.execute("""
-            UPDATE pages
-            SET html_wcag_aa_score = ?,
-                html_wcag_aaa_score = ?,
-                docx_wcag_aa_score = ?,
-                docx_wcag_aaa_score = ?
-            WHERE page_id = ?
-        """, (html_aa, html_aaa, docx_aa, docx_aaa, page_id))
-        self.conn.commit()
+        with self.transaction():
+            self.conn.execute("""
+                UPDATE pages
+                SET html_wcag_aa_score = ?,
+                    html_wcag_aaa_score = ?,
+                    docx_wcag_aa_score = ?,
+                    docx_wcag_aaa_score = ?
+                WHERE page_id = ?
+            """, (html_aa, html_aaa, docx_aa, docx_aaa, page_id))
 
     def get_page_accessibility_summary(self, page_id: str) -> Dict[str, Any]:
         """Get accessibility summary for a page.
@@ -1261,11 +1688,16 @@ class ConversionDatabase:
         cursor = self.conn.execute("""
             SELECT DISTINCT page_id FROM pages WHERE batch_id = ?
         """, (batch_id,))
-        return {row[0] for row in cursor.fetchall()}
+        return {row[0] for row in cursor}
 
     def close(self):
         """Close database connection."""
         if self.conn:
+            # Refresh planner statistics for the indexes used during this session
+            try:
+                self.conn.execute("PRAGMA optimize")
+            except sqlite3.Error:
+                pass
             self.conn.close()
             self.conn = None
 
@@ -1276,3 +1708,34 @@ class ConversionDatabase:
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Context manager exit."""
         self.close()
+
+
+# Process-wide connections handed out by get_default_db(), keyed by
+# (absolute path, read_only)
+_default_dbs: Dict[Tuple[str, bool], ConversionDatabase] = {}
+
+
+def get_default_db(db_path: str = "output/conversion_history.db",
+                   read_only: bool = False) -> ConversionDatabase:
+    """Get a ConversionDatabase shared by every caller in this process.
+
+    The first call for a path opens the connection (and creates the schema);
+    later calls reuse it along with its warmed statement cache. A shared
+    instance that was closed is replaced by a fresh one, so the schema is
+    created again (an in-memory database is gone once closed). Like any
+    sqlite3 connection, it must only be used from the thread that created it.
+
+    Args:
+        db_path: Path to SQLite database file
+        read_only: Open in read-only mode (see ConversionDatabase)
+
+    Returns:
+        The shared ConversionDatabase for this path and mode
+    """
+    # ':memory:' is not a file, so it must not be resolved against the cwd
+    path_key = ':memory:' if str(db_path) == ':memory:' else str(Path(db_path).resolve())
+    key = (path_key, read_only)
+    db = _default_dbs.get(key)
+    if db is None or db.conn is None:
+        db = _default_dbs[key] = ConversionDatabase(db_path, read_only=read_only)
+    return db
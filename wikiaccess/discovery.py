@@ -88,6 +88,12 @@ class PageDiscoveryEngine:
         # Get already converted pages to avoid rediscovering
         converted_pages = self.db.get_all_page_ids(batch_id)
 
+        # Discovery status of every target, fetched together instead of one
+        # is_page_discovered() query per link
+        known_statuses = self.db.get_discovery_statuses(
+            [link_data['target_page_id'] for link_data in broken_links]
+        )
+
         for link_data in broken_links:
             target_page_id = link_data['target_page_id']
             reference_count = link_data.get('reference_count', 1)
@@ -100,11 +106,11 @@ class PageDiscoveryEngine:
                 continue
 
             # Check if already discovered
-            existing = self.db.is_page_discovered(target_page_id)
-            if existing:
-                logger.debug(f"Page already discovered: {target_page_id} (status: {existing['discovery_status']})")
+            existing_status = known_statuses.get(target_page_id)
+            if existing_status:
+                logger.debug(f"Page already discovered: {target_page_id} (status: {existing_status})")
                 # Increment reference count if still discovering
-                if existing['discovery_status'] == 'discovered':
+                if existing_status == 'discovered':
                     self.db.increment_discovery_reference_count(target_page_id)
                 stats['already_known'] += 1
                 continue
@@ -11,6 +11,7 @@ Allows users to:
 """
 
 import sys
+from itertools import chain
 from typing import Optional, List, Dict, Any
 from pathlib import Path
 import logging
@@ -312,24 +313,22 @@ class DiscoveryCLI:
         # Get approved pages or all discovered?
         choice = input("Export (a)ll or only (a)pproved pages? (a/p): ").strip().lower()
 
-        if choice == 'p':
-            pages_to_export = self.db.get_discovered_pages(status='approved')
-        else:
-            pages_to_export = self.db.get_discovered_pages(status='discovered')
+        # Stream the IDs straight from the cursor into the file
+        page_ids = self.db.iter_discovered_page_ids(status='approved' if choice == 'p' else 'discovered')
+        first_id = next(page_ids, None)
 
-        if not pages_to_export:
+        if first_id is None:
             print("No pages to export")
             return
 
         try:
             output_file = Path(filename)
-            with output_file.open('w') as f:
-                for i, page in enumerate(pages_to_export, 1):
-                    page_id = page['target_page_id']
-                    url = self._build_url(page_id)
-                    f.write(f"{i}→{url}\n")
+            exported = 0
+            with output_file.open('w', buffering=1 << 20) as f:
+                for exported, page_id in enumerate(chain([first_id], page_ids), 1):
+                    f.write(f"{exported}→{self._build_url(page_id)}\n")
 
-            print(f"✓ Exported {len(pages_to_export)} pages to {output_file}")
+            print(f"✓ Exported {exported} pages to {output_file}")
         except Exception as e:
             print(f"✗ Error: {e}")
 
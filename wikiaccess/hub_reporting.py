@@ -20,6 +20,7 @@ from .report_components import (
     get_breadcrumb_navigation, get_breadcrumb_javascript, get_jump_to_section_links,
     build_report_header, build_stat_cards
 )
+from .image_reporting import SUCCESS_STATUSES, FAILED_STATUSES
 from .static_helper import get_css_links
 from .template_renderer import TemplateRenderer
 
@@ -110,7 +111,7 @@ class HubReportGenerator:
 
         # 3. Broken/failed images
         for img in image_details:
-            if img.get('status') in ['failed', 'error']:
+            if img.get('status') in FAILED_STATUSES:
                 critical['broken_images'].append({
                     'page': img['page_id'],
                     'filename': img.get('local_filename', 'unknown'),
@@ -192,8 +193,8 @@ class HubReportGenerator:
             )
 
         if image_details:
-            stats['images_success'] = len([img for img in image_details if img.get('status') in ['success', 'cached']])
-            stats['images_failed'] = len([img for img in image_details if img.get('status') in ['failed', 'error']])
+            stats['images_success'] = len([img for img in image_details if img.get('status') in SUCCESS_STATUSES])
+            stats['images_failed'] = len([img for img in image_details if img.get('status') in FAILED_STATUSES])
             stats['alt_text_missing'] = len([img for img in image_details if img.get('alt_text_quality') == 'missing'])
             stats['alt_text_manual'] = len([img for img in image_details if img.get('alt_text_quality') == 'manual'])
 
@@ -266,15 +267,23 @@ class HubReportGenerator:
         </div>
     </section>'''
 
-        # Build issue cards
-        issue_cards = []
+        # Build the whole section as one flat list of fragments, joined once
+        parts = [f'''
+    <section class="critical-issues">
+        <h2>🚨 Critical Issues ({total_critical})</h2>
+        <p class="section-description">High-priority accessibility issues requiring immediate attention</p>
+        <div class="issues-grid">''']
 
         # 1. Missing alt-text
-        if critical['missing_alt_text']:
-            alt_text_items = []
-            for item in critical['missing_alt_text'][:10]:  # Show first 10
+        missing_alt = critical['missing_alt_text']
+        if missing_alt:
+            parts.append(f'''
+                <div class="issue-card issue-critical">
+                    <h3>⚠️ Missing Alt-Text ({len(missing_alt)})</h3>
+                    <div class="issue-list">''')
+            for item in missing_alt[:10]:  # Show first 10
                 escaped_suggestion = html_lib.escape(item['suggested_alt'])
-                alt_text_items.append(f'''
+                parts.append(f'''
                     <div class="issue-item">
                         <div class="issue-details">
                             <strong>{html_lib.escape(item['filename'])}</strong>
@@ -288,24 +297,24 @@ class HubReportGenerator:
                             </button>
                         </div>
                     </div>''')
-
-            more_text = f"<p class='more-items'>... and {len(critical['missing_alt_text']) - 10} more</p>" if len(critical['missing_alt_text']) > 10 else ""
-
-            issue_cards.append(f'''
-                <div class="issue-card issue-critical">
-                    <h3>⚠️ Missing Alt-Text ({len(critical['missing_alt_text'])})</h3>
-                    <div class="issue-list">
-                        {"".join(alt_text_items)}
-                    </div>
-                    {more_text}
+            parts.append('''
+                    </div>''')
+            if len(missing_alt) > 10:
+                parts.append(f"<p class='more-items'>... and {len(missing_alt) - 10} more</p>")
+            parts.append('''
                     <a href="image_report.html" class="view-all-link">View Image Report →</a>
                 </div>''')
 
         # 2. WCAG AA failures
-        if critical['wcag_failures']:
-            wcag_items = []
-            for item in critical['wcag_failures'][:5]:
-                wcag_items.append(f'''
+        wcag_failures = critical['wcag_failures']
+        if wcag_failures:
+            parts.append(f'''
+                <div class="issue-card issue-high">
+                    <h3>📉 WCAG AA Failures ({len(wcag_failures)})</h3>
+                    <p class="issue-description">Pages scoring below 70% on WCAG AA compliance</p>
+                    <div class="issue-list">''')
+            for item in wcag_failures[:5]:
+                parts.append(f'''
                     <div class="issue-item">
                         <strong>{html_lib.escape(item['page'])}</strong>
                         <span class="score-display">
@@ -314,83 +323,70 @@ class HubReportGenerator:
                         </span>
                         <a href="{item['page']}_accessibility.html" class="fix-link">Fix Issues →</a>
                     </div>''')
-
-            more_text = f"<p class='more-items'>... and {len(critical['wcag_failures']) - 5} more</p>" if len(critical['wcag_failures']) > 5 else ""
-
-            issue_cards.append(f'''
-                <div class="issue-card issue-high">
-                    <h3>📉 WCAG AA Failures ({len(critical['wcag_failures'])})</h3>
-                    <p class="issue-description">Pages scoring below 70% on WCAG AA compliance</p>
-                    <div class="issue-list">
-                        {"".join(wcag_items)}
-                    </div>
-                    {more_text}
+            parts.append('''
+                    </div>''')
+            if len(wcag_failures) > 5:
+                parts.append(f"<p class='more-items'>... and {len(wcag_failures) - 5} more</p>")
+            parts.append('''
                 </div>''')
 
         # 3. Broken images
-        if critical['broken_images']:
-            broken_items = []
-            for item in critical['broken_images'][:5]:
-                broken_items.append(f'''
+        broken_images = critical['broken_images']
+        if broken_images:
+            parts.append(f'''
+                <div class="issue-card issue-medium">
+                    <h3>🖼️ Broken Images ({len(broken_images)})</h3>
+                    <div class="issue-list">''')
+            for item in broken_images[:5]:
+                parts.append(f'''
                     <div class="issue-item">
                         <strong>{html_lib.escape(item['filename'])}</strong>
                         <span class="issue-page">on {html_lib.escape(item['page'])}</span>
                         <span class="error-detail">{html_lib.escape(item['error'][:50])}</span>
                     </div>''')
-
-            more_text = f"<p class='more-items'>... and {len(critical['broken_images']) - 5} more</p>" if len(critical['broken_images']) > 5 else ""
-
-            issue_cards.append(f'''
-                <div class="issue-card issue-medium">
-                    <h3>🖼️ Broken Images ({len(critical['broken_images'])})</h3>
-                    <div class="issue-list">
-                        {"".join(broken_items)}
-                    </div>
-                    {more_text}
+            parts.append('''
+                    </div>''')
+            if len(broken_images) > 5:
+                parts.append(f"<p class='more-items'>... and {len(broken_images) - 5} more</p>")
+            parts.append('''
                     <a href="image_report.html" class="view-all-link">View Image Report →</a>
                 </div>''')
 
         # 4. Multi-issue pages
-        if critical['multi_issue_pages']:
-            multi_items = []
-            for item in critical['multi_issue_pages'][:5]:
-                multi_items.append(f'''
+        multi_issue_pages = critical['multi_issue_pages']
+        if multi_issue_pages:
+            parts.append(f'''
+                <div class="issue-card issue-medium">
+                    <h3>📄 Pages with Multiple Issues ({len(multi_issue_pages)})</h3>
+                    <p class="issue-description">Pages with 5 or more accessibility issues</p>
+                    <div class="issue-list">''')
+            for item in multi_issue_pages[:5]:
+                parts.append(f'''
                     <div class="issue-item">
                         <strong>{html_lib.escape(item['page'])}</strong>
                         <span class="issue-count">{item['total_issues']} issues</span>
                         <a href="{item['page']}_accessibility.html" class="fix-link">Review →</a>
                     </div>''')
-
-            more_text = f"<p class='more-items'>... and {len(critical['multi_issue_pages']) - 5} more</p>" if len(critical['multi_issue_pages']) > 5 else ""
-
-            issue_cards.append(f'''
-                <div class="issue-card issue-medium">
-                    <h3>📄 Pages with Multiple Issues ({len(critical['multi_issue_pages'])})</h3>
-                    <p class="issue-description">Pages with 5 or more accessibility issues</p>
-                    <div class="issue-list">
-                        {"".join(multi_items)}
-                    </div>
-                    {more_text}
+            parts.append('''
+                    </div>''')
+            if len(multi_issue_pages) > 5:
+                parts.append(f"<p class='more-items'>... and {len(multi_issue_pages) - 5} more</p>")
+            parts.append('''
                 </div>''')
 
         # 5. Broken links
-        broken_links_count = critical.get('broken_links') or 0
         if broken_links_count > 0:
-            issue_cards.append(f'''
+            parts.append(f'''
                 <div class="issue-card issue-medium">
                     <h3>🔗 Broken Internal Links ({broken_links_count})</h3>
                     <p class="issue-description">Internal wiki links pointing to pages that haven't been converted</p>
                     <a href="broken_links_report.html" class="view-all-link">View Broken Links Report →</a>
                 </div>''')
 
-        return f'''
-    <section class="critical-issues">
-        <h2>🚨 Critical Issues ({total_critical})</h2>
-        <p class="section-description">High-priority accessibility issues requiring immediate attention</p>
-        <div class="issues-grid">
-            {"".join(issue_cards)}
+        parts.append('''
         </div>
-    </section>'''
+    </section>''')
+        return "".join(parts)
 
     def _build_statistics_section(self, stats: Dict) -> str:
         """Build statistics dashboard section"""
@@ -501,7 +497,7 @@ class HubReportGenerator:
                 <p>{broken_links_count} internal links to unconverted pages</p>
             </a>'''
 
-        return f'''
+        parts = [f'''
     <section class="navigation-tiles">
         <h2>📑 Detailed Reports</h2>
         <div class="tiles-grid">
@@ -523,354 +519,16 @@ class HubReportGenerator:
                 <div class="tile-icon">📄</div>
                 <h3>Individual Pages ({len(page_reports)})</h3>
                 <ul class="page-list">
-                    {"".join(f'<li><a href="{page}_accessibility.html">{page}</a></li>' for page in sorted(page_reports.keys())[:10])}
-                    {f'<li><em>... and {len(page_reports) - 10} more pages</em></li>' if len(page_reports) > 10 else ''}
+                    ''']
+        parts.extend(f'<li><a href="{page}_accessibility.html">{page}</a></li>' for page in sorted(page_reports.keys())[:10])
+        if len(page_reports) > 10:
+            parts.append(f'<li><em>... and {len(page_reports) - 10} more pages</em></li>')
+        parts.append('''
                 </ul>
             </div>
         </div>
-    </section>'''
-
-    def _get_hub_css(self) -> str:
-        """Return CSS styles for the hub"""
-        return '''<style>
-        * {
-            margin: 0;
-            padding: 0;
-            box-sizing: border-box;
-        }
-
-        body {
-            font-family: -apple-system, BlinkMacSystemFont, "Segoe UI", Roboto, Arial, sans-serif;
-            font-size: 16px;
-            line-height: 1.6;
-            color: #1a1a1a;
-            background: #f5f5f5;
-        }
-
-        .main-content {
-            max-width: 1400px;
-            margin: 0 auto;
-            padding: 2rem;
-        }
-
-        header {
-            background: white;
-            padding: 2rem;
-            border-radius: 8px;
-            margin-bottom: 2rem;
-            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-            text-align: center;
-        }
-
-        h1 {
-            font-size: 2.5em;
-            margin-bottom: 0.5rem;
-        }
-
-        h2 {
-            font-size: 1.8em;
-            margin-bottom: 1rem;
-        }
-
-        .timestamp {
-            color: #666;
-            font-size: 0.9em;
-        }
-
-        .subtitle {
-            color: #666;
-            font-size: 1.1em;
-            margin-top: 0.5rem;
-        }
-
-        section {
-            background: white;
-            padding: 2rem;
-            border-radius: 8px;
-            margin-bottom: 2rem;
-            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-        }
-
-        .section-description {
-            color: #666;
-            margin-bottom: 1.5rem;
-        }
-
-        /* Critical Issues Section */
-        .critical-issues h2 {
-            color: #dc3545;
-        }
-
-        .critical-issues.all-clear h2 {
-            color: #28a745;
-        }
-
-        .all-clear-message {
-            text-align: center;
-            padding: 3rem;
-            font-size: 1.2em;
-            color: #28a745;
-        }
-
-        .issues-grid {
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(400px, 1fr));
-            gap: 1.5rem;
-        }
-
-        .issue-card {
-            background: #f8f9fa;
-            border-left: 4px solid;
-            padding: 1.5rem;
-            border-radius: 4px;
-        }
-
-        .issue-card.issue-critical {
-            border-color: #dc3545;
-        }
-
-        .issue-card.issue-high {
-            border-color: #ff8800;
-        }
-
-        .issue-card.issue-medium {
-            border-color: #ffc107;
-        }
-
-        .issue-card h3 {
-            margin-bottom: 0.5rem;
-            font-size: 1.2em;
-        }
-
-        .issue-description {
-            color: #666;
-            font-size: 0.9em;
-            margin-bottom: 1rem;
-        }
-
-        .issue-list {
-            margin: 1rem 0;
-        }
-
-        .issue-item {
-            padding: 0.75rem;
-            background: white;
-            border-radius: 4px;
-            margin-bottom: 0.5rem;
-            display: flex;
-            flex-direction: column;
-            gap: 0.5rem;
-        }
-
-        .issue-details {
-            display: flex;
-            flex-direction: column;
-        }
-
-        .issue-page {
-            font-size: 0.85em;
-            color: #666;
-        }
-
-        .quick-fix {
-            display: flex;
-            align-items: center;
-            gap: 1rem;
-            background: #e7f3ff;
-            padding: 0.5rem;
-            border-radius: 4px;
-        }
-
-        .suggestion {
-            flex: 1;
-            font-size: 0.9em;
-            color: #0066cc;
-        }
-
-        .copy-btn {
-            padding: 0.25rem 0.75rem;
-            background: #0066cc;
-            color: white;
-            border: none;
-            border-radius: 4px;
-            cursor: pointer;
-            font-size: 0.85em;
-            font-weight: 600;
-            white-space: nowrap;
-        }
-
-        .copy-btn:hover {
-            background: #0052a3;
-        }
-
-        .copy-btn.copied {
-            background: #28a745;
-        }
-
-        .score-display {
-            font-size: 0.9em;
-        }
-
-        .score-bad {
-            color: #dc3545;
-            font-weight: 600;
-        }
-
-        .issue-count {
-            background: #ffc107;
-            color: #333;
-            padding: 0.25rem 0.5rem;
-            border-radius: 4px;
-            font-size: 0.85em;
-            font-weight: 600;
-        }
-
-        .fix-link, .view-all-link {
-            color: #0066cc;
-            text-decoration: none;
-            font-weight: 600;
-            font-size: 0.9em;
-        }
-
-        .fix-link:hover, .view-all-link:hover {
-            text-decoration: underline;
-        }
-
-        .more-items {
-            margin-top: 1rem;
-            font-style: italic;
-            color: #666;
-            font-size: 0.9em;
-        }
-
-        .error-detail {
-            font-size: 0.85em;
-            color: #999;
-            font-style: italic;
-        }
-
-        /* Statistics Dashboard */
-        .stats-grid {
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(180px, 1fr));
-            gap: 1rem;
-        }
-
-        .stat-card {
-            background: #f8f9fa;
-            padding: 1.5rem;
-            border-radius: 8px;
-            text-align: center;
-            border: 2px solid #e0e0e0;
-        }
-
-        .stat-value {
-            font-size: 2.5em;
-            font-weight: bold;
-            line-height: 1;
-        }
-
-        .stat-label {
-            color: #666;
-            font-size: 0.9em;
-            margin-top: 0.5rem;
-        }
-
-        /* Navigation Tiles */
-        .tiles-grid {
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(300px, 1fr));
-            gap: 1.5rem;
-        }
-
-        .nav-tile {
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            color: white;
-            padding: 2rem;
-            border-radius: 8px;
-            text-decoration: none;
-            transition: transform 0.2s ease, box-shadow 0.2s ease;
-            display: block;
-        }
-
-        .nav-tile:hover {
-            transform: translateY(-4px);
-            box-shadow: 0 8px 16px rgba(0,0,0,0.2);
-        }
-
-        .nav-tile:nth-child(1) {
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-        }
-
-        .nav-tile:nth-child(2) {
-            background: linear-gradient(135deg, #f093fb 0%, #f5576c 100%);
-        }
-
-        .nav-tile:nth-child(3) {
-            background: linear-gradient(135deg, #4facfe 0%, #00f2fe 100%);
-        }
-
-        .nav-tile-pages {
-            color: #1a1a1a;
-            background: #f8f9fa !important;
-            border: 2px solid #e0e0e0;
-        }
-
-        .tile-icon {
-            font-size: 3em;
-            margin-bottom: 0.5rem;
-        }
-
-        .nav-tile h3 {
-            font-size: 1.3em;
-            margin-bottom: 0.5rem;
-            color: inherit;
-        }
-
-        .nav-tile p {
-            font-size: 0.95em;
-            opacity: 0.9;
-        }
-
-        .page-list {
-            list-style: none;
-            margin-top: 1rem;
-            max-height: 200px;
-            overflow-y: auto;
-        }
-
-        .page-list li {
-            padding: 0.25rem 0;
-        }
-
-        .page-list a {
-            color: #0066cc;
-            text-decoration: none;
-        }
-
-        .page-list a:hover {
-            text-decoration: underline;
-        }
-
-        /* Responsive */
-        @media (max-width: 768px) {
-            body {
-                padding: 1rem;
-            }
-
-            .issues-grid {
-                grid-template-columns: 1fr;
-            }
-
-            .stats-grid {
-                grid-template-columns: repeat(2, 1fr);
-            }
-
-            .tiles-grid {
-                grid-template-columns: 1fr;
-            }
-        }
-    </style>'''
+    </section>''')
+        return "".join(parts)
 
     def _get_hub_javascript(self) -> str:
         """Return JavaScript for copy-to-clipboard functionality"""
@@ -13,11 +13,13 @@ Part of WikiAccess: Transform DokuWiki into Accessible Documents
 https://github.com/yourusername/wikiaccess
 """
 
+from collections import Counter
 from pathlib import Path
 from typing import List, Dict
 from datetime import datetime
 import base64
 import html as html_lib
+import os
 from .report_components import (
     get_breadcrumb_navigation, get_breadcrumb_javascript,
     build_report_header, build_stat_cards
@@ -25,6 +27,43 @@ from .report_components import (
 from .static_helper import get_css_links
 from .template_renderer import TemplateRenderer
 
+# Image download statuses grouped for reporting
+SUCCESS_STATUSES = frozenset(('success', 'cached'))
+FAILED_STATUSES = frozenset(('failed', 'error'))
+
+_SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB')
+
+# Alt-text quality -> (badge CSS modifier, title prefix, label); title prefix
+# of None means the badge has a fixed title
+_ALT_TEXT_BADGES = {
+    'missing': ('missing', None, '⚠️ Missing'),
+    'auto-generated': ('auto', 'Auto-generated from filename: ', '🤖 Auto'),
+    'manual': ('manual', 'Manual alt-text: ', '✓ Manual'),
+}
+
+
+def classify_alt_text(img: Dict) -> str:
+    """
+    Classify alt-text quality for an image
+    Returns: 'missing', 'auto-generated', or 'manual'
+    """
+    alt_text = img.get('alt_text', '')
+    filename = img.get('local_filename', '')
+
+    if not alt_text or alt_text.strip() == '':
+        return 'missing'
+
+    # Check if alt-text is auto-generated from filename
+    # Auto-generated alt-text is typically: filename without extension, with underscores/hyphens replaced by spaces
+    if filename:
+        # Generate what the auto-generated alt-text would be
+        auto_generated = filename.replace('_', ' ').replace('-', ' ').rsplit('.', 1)[0]
+        if alt_text.strip().lower() == auto_generated.strip().lower():
+            return 'auto-generated'
+
+    # Otherwise, it's manually provided
+    return 'manual'
+
 
 class ImageReportGenerator:
     """Generate comprehensive image download reports"""
@@ -35,6 +74,7 @@ class ImageReportGenerator:
         self.reports_dir.mkdir(parents=True, exist_ok=True)
         self.images_dir = self.output_dir / 'images'
         self.template_renderer = TemplateRenderer(str(self.output_dir))
+        self._dir_listings = {}  # directory -> set of file names, per build
 
     def generate_image_report(self, image_details: List[Dict], page_list: List[str] = None) -> str:
         """
@@ -57,28 +97,6 @@ class ImageReportGenerator:
         print(f"\n📸 Image Report: {report_path}")
         return str(report_path)
 
-    def _classify_alt_text(self, img: Dict) -> str:
-        """
-        Classify alt-text quality for an image
-        Returns: 'missing', 'auto-generated', or 'manual'
-        """
-        alt_text = img.get('alt_text', '')
-        filename = img.get('local_filename', '')
-
-        if not alt_text or alt_text.strip() == '':
-            return 'missing'
-
-        # Check if alt-text is auto-generated from filename
-        # Auto-generated alt-text is typically: filename without extension, with underscores/hyphens replaced by spaces
-        if filename:
-            # Generate what the auto-generated alt-text would be
-            auto_generated = filename.replace('_', ' ').replace('-', ' ').rsplit('.', 1)[0]
-            if alt_text.strip().lower() == auto_generated.strip().lower():
-                return 'auto-generated'
-
-        # Otherwise, it's manually provided
-        return 'manual'
-
     def _build_image_report_html(self, image_details: List[Dict], page_list: List[str]) -> str:
         """Build the complete image report HTML using component system"""
         timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
@@ -98,34 +116,30 @@ class ImageReportGenerator:
             ]
         )
 
-        # Calculate statistics
-        total_images = len(image_details)
-        successful = len([img for img in image_details if img['status'] in ['success', 'cached']])
-        failed = len([img for img in image_details if img['status'] in ['failed', 'error']])
-        skipped = len([img for img in image_details if img['status'] == 'skipped'])
-
-        # Classify alt-text quality for all images
+        # Classify alt-text quality for images that don't carry it yet; rows
+        # from ReportRegenerator arrive classified and are left untouched
         for img in image_details:
-            img['alt_text_quality'] = self._classify_alt_text(img)
+            if 'alt_text_quality' not in img:
+                img['alt_text_quality'] = classify_alt_text(img)
+
+        # Calculate statistics; Counter tallies each field in one C-level pass
+        total_images = len(image_details)
+        status_counts = Counter(img['status'] for img in image_details)
+        successful = sum(status_counts[status] for status in SUCCESS_STATUSES)
+        failed = sum(status_counts[status] for status in FAILED_STATUSES)
+        skipped = status_counts['skipped']
 
         # Count alt-text quality
+        quality_counts = Counter(img['alt_text_quality'] for img in image_details)
         alt_text_stats = {
-            'missing': len([img for img in image_details if img['alt_text_quality'] == 'missing']),
-            'auto_generated': len([img for img in image_details if img['alt_text_quality'] == 'auto-generated']),
-            'manual': len([img for img in image_details if img['alt_text_quality'] == 'manual'])
+            'missing': quality_counts['missing'],
+            'auto_generated': quality_counts['auto-generated'],
+            'manual': quality_counts['manual']
         }
 
-        # Group by type
-        by_type = {}
-        for img in image_details:
-            img_type = img['type']
-            by_type[img_type] = by_type.get(img_type, 0) + 1
-
-        # Group by page
-        by_page = {}
-        for img in image_details:
-            page_id = img['page_id']
-            by_page[page_id] = by_page.get(page_id, 0) + 1
+        # Group by type and by page
+        by_type = dict(Counter(img['type'] for img in image_details))
+        by_page = dict(Counter(img['page_id'] for img in image_details))
 
         # Calculate total file size
         total_size = sum(img['file_size'] or 0 for img in image_details)
@@ -261,16 +275,16 @@ class ImageReportGenerator:
 
     def _get_alt_text_badge(self, quality: str, alt_text: str) -> str:
         """Generate HTML badge for alt-text quality"""
-        if quality == 'missing':
-            return '<span class="alt-badge alt-badge-missing" title="No alt-text provided">⚠️ Missing</span>'
-        elif quality == 'auto-generated':
-            return f'<span class="alt-badge alt-badge-auto" title="Auto-generated from filename: {alt_text}">🤖 Auto</span>'
-        else:  # manual
-            return f'<span class="alt-badge alt-badge-manual" title="Manual alt-text: {alt_text}">✓ Manual</span>'
+        modifier, title_prefix, label = _ALT_TEXT_BADGES.get(quality, _ALT_TEXT_BADGES['manual'])
+        title = 'No alt-text provided' if title_prefix is None else f'{title_prefix}{alt_text}'
+        return f'<span class="alt-badge alt-badge-{modifier}" title="{title}">{label}</span>'
 
     def _build_sortable_table(self, image_details: List[Dict]) -> str:
         """Build sortable HTML table with image details and expandable rows"""
+        # One directory listing per build instead of a stat() per thumbnail
+        self._dir_listings = {}
         rows = []
+        escape = html_lib.escape
         for idx, img in enumerate(image_details):
             status_class = f"status-{img['status']}"
             thumbnail = self._get_thumbnail_html(img)
@@ -280,6 +294,8 @@ class ImageReportGenerator:
             # Truncate alt-text for display (show first 40 chars)
             alt_text_full = img.get('alt_text', 'N/A')
             alt_text_display = alt_text_full[:40] + '...' if len(alt_text_full) > 40 else alt_text_full
+            # Escape each value once; the full alt-text appears in two cells
+            alt_text_full_escaped = escape(alt_text_full)
 
             error_display = f'<span class="error-msg" title="{img["error_message"]}">{img["error_message"][:50]}...</span>' if img['error_message'] else ''
 
@@ -291,11 +307,11 @@ class ImageReportGenerator:
                             <div class="detail-grid">
                                 <div class="detail-item">
                                     <strong>Full Alt-Text:</strong>
-                                    <p>{html_lib.escape(alt_text_full)}</p>
+                                    <p>{alt_text_full_escaped}</p>
                                 </div>
                                 <div class="detail-item">
                                     <strong>Source URL:</strong>
-                                    <p>{html_lib.escape(img.get('source_url', 'N/A'))}</p>
+                                    <p>{escape(img.get('source_url', 'N/A'))}</p>
                                 </div>
                                 <div class="detail-item">
                                     <strong>Dimensions:</strong>
@@ -307,7 +323,7 @@ class ImageReportGenerator:
                                 </div>
                                 {f'''<div class="detail-item full-width">
                                     <strong>Error Details:</strong>
-                                    <p class="error-detail">{html_lib.escape(img["error_message"])}</p>
+                                    <p class="error-detail">{escape(img["error_message"])}</p>
                                 </div>''' if img.get('error_message') else ''}
                             </div>
                         </div>
@@ -324,7 +340,7 @@ class ImageReportGenerator:
                     <td class="filename-cell" title="{img['local_filename'] or 'N/A'}">{img['local_filename'] or 'N/A'}</td>
                     <td class="status-cell"><span class="{status_class}">{img['status'].upper()}</span></td>
                     <td class="alt-quality-cell">{alt_text_badge}</td>
-                    <td class="alt-text-cell" title="{html_lib.escape(alt_text_full)}">{html_lib.escape(alt_text_display)}</td>
+                    <td class="alt-text-cell" title="{alt_text_full_escaped}">{escape(alt_text_display)}</td>
                     <td class="size-cell" data-size="{img['file_size'] or 0}">{file_size_str}</td>
                 </tr>
                 {details_html}''')
@@ -353,9 +369,9 @@ class ImageReportGenerator:
 
     def _get_thumbnail_html(self, img: Dict) -> str:
         """Generate thumbnail HTML for image"""
-        if img['status'] in ['success', 'cached'] and img['local_path']:
+        if img['status'] in SUCCESS_STATUSES and img['local_path']:
             local_path = Path(img['local_path'])
-            if local_path.exists():
+            if local_path.name in self._list_directory(local_path.parent):
                 # Use relative path from reports dir to images dir
                 rel_path = f"../images/{img['local_filename']}"
                 return f'<a href="{rel_path}" class="thumbnail-link" target="_blank"><img src="{rel_path}" alt="{img["alt_text"]}" class="thumbnail" loading="lazy"></a>'
@@ -363,658 +379,25 @@ class ImageReportGenerator:
         # No thumbnail available
         return '<span class="no-thumbnail">✗</span>'
 
+    def _list_directory(self, directory: Path) -> set:
+        """Return the file names in directory, scanning it at most once per build"""
+        listings = self._dir_listings
+        if directory not in listings:
+            try:
+                with os.scandir(directory) as entries:
+                    listings[directory] = {entry.name for entry in entries if entry.is_file()}
+            except OSError:
+                listings[directory] = set()
+        return listings[directory]
+
     def _format_file_size(self, size_bytes) -> str:
         """Format file size in human-readable format"""
         if size_bytes is None:
             return 'N/A'
 
-        for unit in ['B', 'KB', 'MB', 'GB']:
-            if size_bytes < 1024.0:
-                return f"{size_bytes:.1f} {unit}"
-            size_bytes /= 1024.0
-
-        return f"{size_bytes:.1f} TB"
-
-    def _get_css_styles(self) -> str:
-        """Return CSS styles for the report"""
-        return '''<style>
-        * {
-            margin: 0;
-            padding: 0;
-            box-sizing: border-box;
-        }
-
-        body {
-            font-family: -apple-system, BlinkMacSystemFont, "Segoe UI", Roboto, Arial, sans-serif;
-            font-size: 16px;
-            line-height: 1.6;
-            color: #1a1a1a;
-            background: #f5f5f5;
-        }
-
-        .main-content {
-            max-width: 1600px;
-            margin: 0 auto;
-            padding: 2rem;
-        }
-
-        header {
-            background: white;
-            padding: 2rem;
-            border-radius: 8px;
-            margin-bottom: 2rem;
-            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-        }
-
-        h1 {
-            font-size: 2em;
-            margin-bottom: 0.5rem;
-        }
-
-        h2 {
-            font-size: 1.5em;
-            margin-bottom: 1rem;
-        }
-
-        .timestamp {
-            color: #666;
-            font-size: 0.9em;
-        }
-
-        /* Statistics Dashboard */
-        .statistics {
-            background: white;
-            padding: 2rem;
-            border-radius: 8px;
-            margin-bottom: 2rem;
-            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-        }
-
-        .stats-grid {
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(150px, 1fr));
-            gap: 1rem;
-            margin-bottom: 2rem;
-        }
-
-        .stat-card {
-            background: #f8f9fa;
-            padding: 1.5rem;
-            border-radius: 6px;
-            text-align: center;
-            border: 2px solid #e0e0e0;
-        }
-
-        .stat-card.stat-success {
-            border-color: #28a745;
-            background: #e8f5e9;
-        }
-
-        .stat-card.stat-failed {
-            border-color: #dc3545;
-            background: #ffebee;
-        }
-
-        .stat-card.stat-skipped {
-            border-color: #ffc107;
-            background: #fff9e6;
-        }
-
-        .stat-value {
-            font-size: 2em;
-            font-weight: bold;
-            line-height: 1;
-            color: #1a1a1a;
-        }
-
-        .stat-label {
-            color: #666;
-            font-size: 0.9em;
-            margin-top: 0.5rem;
-        }
-
-        .breakdown {
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(250px, 1fr));
-            gap: 2rem;
-        }
-
-        .breakdown-section h3 {
-            font-size: 1.1em;
-            margin-bottom: 0.75rem;
-            color: #333;
-        }
-
-        .breakdown-section ul {
-            list-style: none;
-        }
-
-        .breakdown-section li {
-            padding: 0.25rem 0;
-            border-bottom: 1px solid #e0e0e0;
-        }
-
-        /* Table Section */
-        .table-section {
-            background: white;
-            padding: 2rem;
-            border-radius: 8px;
-            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-        }
-
-        .table-controls {
-            display: flex;
-            gap: 1rem;
-            margin-bottom: 1rem;
-            flex-wrap: wrap;
-            align-items: center;
-        }
-
-        .table-controls label {
-            font-weight: 600;
-        }
-
-        .table-controls select {
-            padding: 0.5rem;
-            border: 2px solid #0047b3;
-            border-radius: 4px;
-            font-size: 0.9rem;
-            min-width: 150px;
-        }
-
-        .table-wrapper {
-            overflow-x: auto;
-        }
-
-        table {
-            width: 100%;
-            border-collapse: collapse;
-            min-width: 900px;
-        }
-
-        thead {
-            background: #0047b3;
-            color: white;
-            position: sticky;
-            top: 0;
-        }
-
-        th {
-            padding: 1rem 1.25rem;
-            text-align: left;
-            cursor: pointer;
-            user-select: none;
-            font-size: 0.9em;
-            font-weight: 600;
-            letter-spacing: 0.05em;
-        }
-
-        th:hover {
-            background: #003580;
-        }
-
-        tbody tr {
-            border-bottom: 1px solid #e0e0e0;
-        }
-
-        tbody tr:nth-child(even) {
-            background: #f9f9f9;
-        }
-
-        tbody tr:hover {
-            background: #f0f0f0;
-        }
-
-        td {
-            padding: 1rem 1.25rem;
-            font-size: 0.9em;
-        }
-
-        /* Cell-specific styling */
-        .thumbnail-cell {
-            text-align: center;
-            padding: 1rem;
-            background: #fafafa;
-        }
-
-        .page-cell {
-            max-width: 180px;
-            overflow: hidden;
-            text-overflow: ellipsis;
-            white-space: nowrap;
-            padding: 1rem 1.25rem;
-        }
-
-        .filename-cell {
-            max-width: 220px;
-            overflow: hidden;
-            text-overflow: ellipsis;
-            white-space: nowrap;
-            font-family: monospace;
-            font-size: 0.85em;
-            padding: 1rem 1.25rem;
-        }
-
-        .alt-text-cell {
-            max-width: 200px;
-            overflow: hidden;
-            text-overflow: ellipsis;
-            white-space: nowrap;
-            padding: 1rem 1.25rem;
-        }
-
-        .type-cell {
-            text-transform: uppercase;
-            font-size: 0.8em;
-            font-weight: 600;
-            color: #666;
-        }
-
-        .size-cell {
-            text-align: right;
-            font-variant-numeric: tabular-nums;
-            font-family: monospace;
-            font-size: 0.85em;
-        }
-
-        .thumbnail {
-            width: 60px;
-            height: 60px;
-            object-fit: cover;
-            border-radius: 4px;
-            border: 2px solid #e0e0e0;
-        }
-
-        .thumbnail-link:hover .thumbnail {
-            border-color: #0047b3;
-            transform: scale(1.05);
-            transition: all 0.2s ease;
-        }
-
-        .no-thumbnail {
-            display: inline-block;
-            width: 60px;
-            height: 60px;
-            line-height: 60px;
-            text-align: center;
-            background: #f0f0f0;
-            border-radius: 4px;
-            color: #999;
-            font-size: 1.5rem;
-        }
-
-        /* Status badges */
-        .status-success, .status-cached {
-            background: #28a745;
-            color: white;
-            padding: 0.25rem 0.5rem;
-            border-radius: 4px;
-            font-weight: 600;
-            font-size: 0.85em;
-        }
-
-        .status-cached {
-            background: #17a2b8;
-        }
-
-        .status-failed, .status-error {
-            background: #dc3545;
-            color: white;
-            padding: 0.25rem 0.5rem;
-            border-radius: 4px;
-            font-weight: 600;
-            font-size: 0.85em;
-        }
-
-        .status-skipped {
-            background: #ffc107;
-            color: #333;
-            padding: 0.25rem 0.5rem;
-            border-radius: 4px;
-            font-weight: 600;
-            font-size: 0.85em;
-        }
-
-        /* Alt-text quality badges */
-        .alt-badge {
-            display: inline-block;
-            padding: 0.25rem 0.5rem;
-            border-radius: 4px;
-            font-weight: 600;
-            font-size: 0.85em;
-            white-space: nowrap;
-        }
-
-        .alt-badge-missing {
-            background: #dc3545;
-            color: white;
-        }
-
-        .alt-badge-auto {
-            background: #ffc107;
-            color: #333;
-        }
-
-        .alt-badge-manual {
-            background: #28a745;
-            color: white;
-        }
-
-        /* Alt-text quality in breakdown section */
-        .alt-missing {
-            color: #dc3545;
-            font-weight: 600;
-        }
-
-        .alt-auto {
-            color: #cc8800;
-        }
-
-        .alt-manual {
-            color: #28a745;
-            font-weight: 600;
-        }
-
-        /* Error messages */
-        .error-msg {
-            color: #dc3545;
-            font-size: 0.85em;
-            font-style: italic;
-        }
-
-        /* Expandable detail rows */
-        .image-row:hover {
-            background: #e3f2fd !important;
-        }
-
-        .detail-row {
-            background: #f8f9fa !important;
-        }
-
-        .detail-content {
-            padding: 1.5rem;
-            animation: slideDown 0.3s ease;
-        }
-
-        @keyframes slideDown {
-            from {
-                opacity: 0;
-                transform: translateY(-10px);
-            }
-            to {
-                opacity: 1;
-                transform: translateY(0);
-            }
-        }
-
-        .detail-grid {
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(250px, 1fr));
-            gap: 1rem;
-        }
-
-        .detail-item {
-            background: white;
-            padding: 1rem;
-            border-radius: 4px;
-            border: 1px solid #e0e0e0;
-        }
-
-        .detail-item.full-width {
-            grid-column: 1 / -1;
-        }
-
-        .detail-item strong {
-            display: block;
-            color: #666;
-            font-size: 0.85em;
-            text-transform: uppercase;
-            margin-bottom: 0.5rem;
-            letter-spacing: 0.05em;
-        }
-
-        .detail-item p {
-            margin: 0;
-            color: #1a1a1a;
-            word-break: break-word;
-        }
-
-        .error-detail {
-            color: #dc3545;
-            font-family: monospace;
-            font-size: 0.9em;
-        }
-
-        /* Image Lightbox Modal */
-        .image-modal {
-            display: none;
-            position: fixed;
-            z-index: 1000;
-            left: 0;
-            top: 0;
-            width: 100%;
-            height: 100%;
-            background-color: rgba(0, 0, 0, 0.8);
-            animation: fadeIn 0.3s ease;
-        }
-
-        .image-modal.show {
-            display: flex;
-            align-items: center;
-            justify-content: center;
-        }
-
-        @keyframes fadeIn {
-            from { opacity: 0; }
-            to { opacity: 1; }
-        }
-
-        .modal-content {
-            max-width: 90%;
-            max-height: 90vh;
-            position: relative;
-            background: white;
-            border-radius: 8px;
-            padding: 1rem;
-            box-shadow: 0 4px 20px rgba(0, 0, 0, 0.3);
-        }
-
-        .modal-image {
-            max-width: 100%;
-            max-height: 80vh;
-            object-fit: contain;
-            border-radius: 4px;
-        }
-
-        .modal-close {
-            position: absolute;
-            top: 0.5rem;
-            right: 0.5rem;
-            font-size: 2rem;
-            font-weight: bold;
-            color: #333;
-            background: white;
-            border: none;
-            border-radius: 4px;
-            width: 2.5rem;
-            height: 2.5rem;
-            cursor: pointer;
-            display: flex;
-            align-items: center;
-            justify-content: center;
-            z-index: 1001;
-        }
-
-        .modal-close:hover {
-            background: #f0f0f0;
-        }
-
-        .thumbnail-link {
-            cursor: zoom-in;
-        }
-
-        /* Responsive */
-        @media (max-width: 768px) {
-            body {
-                padding: 1rem;
-            }
-
-            .stats-grid {
-                grid-template-columns: repeat(2, 1fr);
-            }
-
-            .breakdown {
-                grid-template-columns: 1fr;
-            }
-
-            .thumbnail {
-                width: 50px;
-                height: 50px;
-            }
-
-            .no-thumbnail {
-                width: 50px;
-                height: 50px;
-                line-height: 50px;
-                font-size: 1.2rem;
-            }
-
-            th, td {
-                padding: 0.5rem;
-                font-size: 0.85em;
-            }
-        }
-    </style>'''
-
-    def _get_javascript(self) -> str:
-        """Return JavaScript for sorting, filtering, and expandable rows"""
-        return '''<script>
-        // Toggle expandable detail rows
-        function toggleDetails(rowIndex) {
-            const detailRow = document.getElementById('detail-' + rowIndex);
-            if (detailRow.style.display === 'none' || detailRow.style.display === '') {
-                detailRow.style.display = 'table-row';
-            } else {
-                detailRow.style.display = 'none';
-            }
-        }
-
-        // Sort table by column
-        let sortDirection = 1;
-        let lastSortedColumn = -1;
-
-        function sortTable(columnIndex) {
-            const table = document.getElementById('image-table');
-            const tbody = table.tBodies[0];
-
-            // Get only image rows (not detail rows)
-            const rows = Array.from(tbody.rows).filter(row => row.classList.contains('image-row'));
-
-            // Toggle direction if same column
-            if (columnIndex === lastSortedColumn) {
-                sortDirection *= -1;
-            } else {
-                sortDirection = 1;
-                lastSortedColumn = columnIndex;
-            }
-
-            rows.sort((a, b) => {
-                let aValue = a.cells[columnIndex].textContent.trim();
-                let bValue = b.cells[columnIndex].textContent.trim();
-
-                // Special handling for size column (use data attribute) - column index 8
-                if (columnIndex === 8) {
-                    aValue = parseInt(a.cells[columnIndex].dataset.size) || 0;
-                    bValue = parseInt(b.cells[columnIndex].dataset.size) || 0;
-                    return sortDirection * (aValue - bValue);
-                }
-
-                // String comparison
-                return sortDirection * aValue.localeCompare(bValue);
-            });
-
-            // Clear tbody and re-append rows with their detail rows
-            tbody.innerHTML = '';
-            rows.forEach((row, idx) => {
-                tbody.appendChild(row);
-                // Find and append corresponding detail row
-                const detailRow = document.getElementById('detail-' + row.getAttribute('onclick').match(/\\d+/)[0]);
-                if (detailRow) {
-                    tbody.appendChild(detailRow);
-                }
-            });
-        }
-
-        // Filter table
-        function filterTable() {
-            const statusFilter = document.getElementById('filter-status').value;
-            const pageFilter = document.getElementById('filter-page').value;
-            const altQualityFilter = document.getElementById('filter-alt-quality').value;
-            const rows = document.querySelectorAll('.image-row');
-
-            rows.forEach(row => {
-                const status = row.dataset.status;
-                const page = row.dataset.page;
-                const altQuality = row.dataset.altQuality;
-
-                const statusMatch = statusFilter === 'all' || status === statusFilter;
-                const pageMatch = pageFilter === 'all' || page === pageFilter;
-                const altQualityMatch = altQualityFilter === 'all' || altQuality === altQualityFilter;
-
-                row.style.display = (statusMatch && pageMatch && altQualityMatch) ? '' : 'none';
-            });
-        }
-
-        // Keyboard accessibility for sortable headers
-        document.querySelectorAll('th[onclick]').forEach(th => {
-            th.addEventListener('keypress', (e) => {
-                if (e.key === 'Enter' || e.key === ' ') {
-                    e.preventDefault();
-                    th.click();
-                }
-            });
-        });
-
-        // Image lightbox functionality
-        function openImageModal(imageSrc, altText) {
-            const modal = document.getElementById('imageModal');
-            const modalImage = document.getElementById('modalImage');
-            modalImage.src = imageSrc;
-            modalImage.alt = altText;
-            modal.classList.add('show');
-            document.body.style.overflow = 'hidden';
-        }
-
-        function closeImageModal() {
-            const modal = document.getElementById('imageModal');
-            modal.classList.remove('show');
-            document.body.style.overflow = 'auto';
-        }
-
-        // Setup thumbnail click handlers
-        document.querySelectorAll('.thumbnail-link').forEach(link => {
-            link.addEventListener('click', (e) => {
-                e.preventDefault();
-                const img = link.querySelector('img');
-                openImageModal(img.src, img.alt);
-            });
-        });
-
-        // Close modal on background click
-        document.addEventListener('click', (e) => {
-            const modal = document.getElementById('imageModal');
-            if (e.target === modal) {
-                closeImageModal();
-            }
-        });
-
-        // Close modal on escape key
-        document.addEventListener('keydown', (e) => {
-            if (e.key === 'Escape') {
-                closeImageModal();
-            }
-        });
-    </script>'''
+        # Unit index from the bit length (each unit is 10 bits) instead of a division loop
+        unit = min(len(_SIZE_UNITS) - 1, (int(size_bytes).bit_length() - 1) // 10) if size_bytes >= 1024 else 0
+        return f"{size_bytes / (1 << (10 * unit)):.1f} {_SIZE_UNITS[unit]}"
 
 
 if __name__ == '__main__':
@@ -5,16 +5,53 @@ Rewrites internal wiki links in generated HTML files to point to local HTML file
 Tracks links in the database and identifies broken links (missing target pages).
 """
 
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, Tuple, Optional, Set
 from urllib.parse import urlparse, parse_qs, unquote
-import re
-from bs4 import BeautifulSoup
+import sys
+import lxml.html
+from .static_helper import write_text_atomic
+
+# The generated pages are always UTF-8; stating it spares libxml2 a guess
+_HTML_PARSER = lxml.html.HTMLParser(encoding='utf-8')
+
+
+@lru_cache(maxsize=4096)
+def _page_id_from_url(wiki_domain: str, url: str) -> Optional[str]:
+    """Cached body of LinkRewriter.extract_page_id_from_url().
+
+    The same navigation and cross-reference hrefs recur in every page, so
+    each distinct URL is parsed with urlparse/parse_qs only once.
+    """
+    # Check if it's a URL from our wiki
+    if not url.startswith(wiki_domain):
+        return None
+
+    # Parse DokuWiki URL format: /doku.php?id=page_id
+    if 'doku.php' in url:
+        parsed = urlparse(url)
+        query_params = parse_qs(parsed.query)
+        page_id = query_params.get('id', [''])[0]
+
+        # Remove anchor if present
+        if '#' in page_id:
+            page_id = page_id.split('#')[0]
+
+        # Remove leading colon if present (DokuWiki format quirk)
+        page_id = page_id.lstrip(':')
+
+        return page_id if page_id else None
+
+    return None
 
 
 class LinkRewriter:
     """Rewrites internal wiki links to local HTML paths."""
 
+    # Per-file progress lines are written to stdout in chunks of this size
+    PROGRESS_FLUSH_EVERY = 500
+
     def __init__(self, wiki_url: str, output_dir: str, db=None):
         """
         Initialize link rewriter.
@@ -55,26 +92,7 @@ class LinkRewriter:
         if not url:
             return None
 
-        # Check if it's a URL from our wiki
-        if not url.startswith(self.wiki_domain):
-            return None
-
-        # Parse DokuWiki URL format: /doku.php?id=page_id
-        if 'doku.php' in url:
-            parsed = urlparse(url)
-            query_params = parse_qs(parsed.query)
-            page_id = query_params.get('id', [''])[0]
-
-            # Remove anchor if present
-            if '#' in page_id:
-                page_id = page_id.split('#')[0]
-
-            # Remove leading colon if present (DokuWiki format quirk)
-            page_id = page_id.lstrip(':')
-
-            return page_id if page_id else None
-
-        return None
+        return _page_id_from_url(self.wiki_domain, url)
 
     def page_id_to_filename(self, page_id: str) -> str:
         """
@@ -125,21 +143,29 @@ class LinkRewriter:
         Returns:
             Tuple of (links_found, links_rewritten, links_broken)
         """
-        # Read HTML file
-        with open(html_path, 'r', encoding='utf-8') as f:
-            soup = BeautifulSoup(f, 'html.parser')
+        # lxml reads and decodes the file itself, so the page never exists as
+        # a Python str; only anchors are visited and changed
+        tree = lxml.html.parse(str(html_path), parser=_HTML_PARSER)
+        root = tree.getroot()
 
         links_found = 0
         links_rewritten = 0
         links_broken = 0
+        # Link records for the database, inserted together once the file is done
+        track_links = bool(self.db and batch_id)
+        tracked_links = []
 
         # Extract source page ID from filename
         source_page_id = html_path.stem.replace('_', ':')
 
         # Find all links
-        for link in soup.find_all('a', href=True):
-            href = link['href']
+        for link in root.iter('a'):
+            href = link.get('href')
+            if href is None:
+                continue
             links_found += 1
+            # Same text as BeautifulSoup's get_text(strip=True)
+            link_text = ''.join(text.strip() for text in link.itertext())[:200] if track_links else ''
 
             # Extract page ID from URL
             target_page_id = self.extract_page_id_from_url(href)
@@ -159,15 +185,15 @@ class LinkRewriter:
                 if target_filename in available_pages:
                     # Rewrite to local HTML file
                     new_href = self.page_id_to_filename(target_page_id) + anchor
-                    link['href'] = new_href
+                    link.set('href', new_href)
                     links_rewritten += 1
 
                     # Track in database
                     if self.db and batch_id:
-                        self.db.add_link({
+                        tracked_links.append({
                             'source_page_id': source_page_id,
                             'target_page_id': target_page_id,
-                            'link_text': link.get_text(strip=True)[:200],
+                            'link_text': link_text,
                             'link_type': 'internal',
                             'resolution_status': 'found',
                             'batch_id': batch_id
@@ -178,10 +204,10 @@ class LinkRewriter:
 
                     # Track in database
                     if self.db and batch_id:
-                        self.db.add_link({
+                        tracked_links.append({
                             'source_page_id': source_page_id,
                             'target_page_id': target_page_id,
-                            'link_text': link.get_text(strip=True)[:200],
+                            'link_text': link_text,
                             'link_type': 'internal',
                             'resolution_status': 'missing',
                             'batch_id': batch_id
@@ -193,19 +219,23 @@ class LinkRewriter:
                     parsed = urlparse(href)
                     external_domain = f"{parsed.scheme}://{parsed.netloc}"
 
-                    self.db.add_link({
+                    tracked_links.append({
                         'source_page_id': source_page_id,
                         'target_page_id': external_domain,
-                        'link_text': link.get_text(strip=True)[:200],
+                        'link_text': link_text,
                         'link_type': 'external',
                         'resolution_status': 'external',
                         'batch_id': batch_id
                     })
 
+        if tracked_links:
+            self.db.add_links(tracked_links)
+
         # Write modified HTML back
         if links_rewritten > 0:
-            with open(html_path, 'w', encoding='utf-8') as f:
-                f.write(str(soup))
+            doctype = tree.docinfo.doctype
+            html_out = lxml.html.tostring(root, encoding='unicode', doctype=doctype or None)
+            write_text_atomic(html_path, html_out + '\n')
 
         return links_found, links_rewritten, links_broken
 
@@ -227,9 +257,10 @@ class LinkRewriter:
         available_pages = self.get_available_pages()
         print(f"Found {len(available_pages)} converted pages")
 
-        # Process each HTML file
+        # Process each HTML file; progress is buffered rather than flushed per file
+        progress = []
         for html_file in self.html_dir.glob('*.html'):
-            print(f"Processing: {html_file.name}")
+            progress.append(f"Processing: {html_file.name}\n")
 
             try:
                 found, rewritten, broken = self.rewrite_links_in_html(
@@ -244,9 +275,16 @@ class LinkRewriter:
                 self.stats['links_broken'] += broken
 
                 if rewritten > 0 or broken > 0:
-                    print(f"  Links: {found} found, {rewritten} rewritten, {broken} broken")
+                    progress.append(f"  Links: {found} found, {rewritten} rewritten, {broken} broken\n")
 
             except Exception as e:
-                print(f"  Error processing {html_file.name}: {e}")
+                progress.append(f"  Error processing {html_file.name}: {e}\n")
+
+            if len(progress) >= self.PROGRESS_FLUSH_EVERY:
+                sys.stdout.write(''.join(progress))
+                sys.stdout.flush()
+                progress.clear()
 
+        sys.stdout.write(''.join(progress))
+        sys.stdout.flush()
         return self.stats
@@ -26,28 +26,43 @@ import requests
 from io import BytesIO
 
 
+# Compiled once at import; every DokuWikiParser shares them
+_PATTERNS = {
+    'heading5': re.compile(r'^={5}\s*(.+?)\s*={5}$'),
+    'heading4': re.compile(r'^={4}\s*(.+?)\s*={4}$'),
+    'heading3': re.compile(r'^={3}\s*(.+?)\s*={3}$'),
+    'heading2': re.compile(r'^={2}\s*(.+?)\s*={2}$'),
+    # All four heading levels in one scan; the greedy opening run backtracks
+    # from 5 to 2, so the level matched is the one the per-level loop found first
+    'heading': re.compile(r'^(={2,5})\s*(.+?)\s*\1$'),
+    'bold': re.compile(r'\*\*(.+?)\*\*'),
+    'italic': re.compile(r'//(.+?)//'),
+    'underline': re.compile(r'__(.+?)__'),
+    'link': re.compile(r'\[\[(.+?)\|(.+?)\]\]'),
+    'link_simple': re.compile(r'\[\[(.+?)\]\]'),
+    'equation_block': re.compile(r'\$\$(.+?)\$\$', re.DOTALL),
+    # Inline equation: single $ but not $$ (use negative lookahead/lookbehind)
+    'equation_inline': re.compile(r'(?<!\$)\$(?!\$)([^\$]+)\$(?!\$)'),
+    'image': re.compile(r'\{\{\s*(.+?)\s*(?:\?(\d+))?\s*\}\}'),
+    'youtube': re.compile(r'\{\{\s*youtube>(.+?)\s*\}\}'),
+    'list_item': re.compile(r'^\s{2}\*\s+(.+)$'),
+    'linebreak': re.compile(r'\\\\'),
+}
+
+# Inline formatting, in tie-break order. The alternation finds the earliest
+# match of any of them in a single scan, and at a shared start position the
+# first listed alternative wins, as in the old search-each-pattern loop.
+_INLINE_TYPES = ('link', 'link_simple', 'bold', 'underline', 'italic', 'equation_inline')
+_INLINE_RE = re.compile('|'.join(
+    f'(?P<{name}>{_PATTERNS[name].pattern})' for name in _INLINE_TYPES
+))
+
+
 class DokuWikiParser:
     """Parse DokuWiki syntax into structured elements"""
     
     def __init__(self):
-        self.patterns = {
-            'heading5': re.compile(r'^={5}\s*(.+?)\s*={5}$'),
-            'heading4': re.compile(r'^={4}\s*(.+?)\s*={4}$'),
-            'heading3': re.compile(r'^={3}\s*(.+?)\s*={3}$'),
-            'heading2': re.compile(r'^={2}\s*(.+?)\s*={2}$'),
-            'bold': re.compile(r'\*\*(.+?)\*\*'),
-            'italic': re.compile(r'//(.+?)//'),
-            'underline': re.compile(r'__(.+?)__'),
-            'link': re.compile(r'\[\[(.+?)\|(.+?)\]\]'),
-            'link_simple': re.compile(r'\[\[(.+?)\]\]'),
-            'equation_block': re.compile(r'\$\$(.+?)\$\$', re.DOTALL),
-            # Inline equation: single $ but not $$ (use negative lookahead/lookbehind)
-            'equation_inline': re.compile(r'(?<!\$)\$(?!\$)([^\$]+)\$(?!\$)'),
-            'image': re.compile(r'\{\{\s*(.+?)\s*(?:\?(\d+))?\s*\}\}'),
-            'youtube': re.compile(r'\{\{\s*youtube>(.+?)\s*\}\}'),
-            'list_item': re.compile(r'^\s{2}\*\s+(.+)$'),
-            'linebreak': re.compile(r'\\\\'),
-        }
+        self.patterns = _PATTERNS
     
     def parse_line(self, line: str) -> Dict:
         """Parse a single line and return its type and content"""
@@ -58,15 +73,13 @@ class DokuWikiParser:
             return {'type': 'empty', 'content': ''}
         
         # Check for headings (must be exact match)
-        for level in [5, 4, 3, 2]:
-            pattern = self.patterns[f'heading{level}']
-            match = pattern.match(line)
-            if match:
-                return {
-                    'type': 'heading',
-                    'level': level,
-                    'content': match.group(1).strip()
-                }
+        match = self.patterns['heading'].match(line)
+        if match:
+            return {
+                'type': 'heading',
+                'level': len(match.group(1)),
+                'content': match.group(2).strip()
+            }
         
         # Check for list items
         match = self.patterns['list_item'].match(line)
@@ -112,60 +125,36 @@ class DokuWikiParser:
         result = []
         pos = 0
         
-        # Create a list of all inline patterns to match
-        inline_patterns = [
-            ('link', self.patterns['link']),
-            ('link_simple', self.patterns['link_simple']),
-            ('bold', self.patterns['bold']),
-            ('underline', self.patterns['underline']),
-            ('italic', self.patterns['italic']),
-            ('equation_inline', self.patterns['equation_inline']),
-        ]
-        
         while pos < len(text):
-            # Find the earliest match among all patterns
-            earliest_match = None
-            earliest_pos = len(text)
-            earliest_type = None
-            
-            for pattern_type, pattern in inline_patterns:
-                match = pattern.search(text, pos)
-                if match and match.start() < earliest_pos:
-                    earliest_match = match
-                    earliest_pos = match.start()
-                    earliest_type = pattern_type
-            
-            if earliest_match:
-                # Add any text before the match
-                if earliest_pos > pos:
-                    result.append(('text', {'content': text[pos:earliest_pos]}))
-                
-                # Add the matched element
-                if earliest_type == 'link':
-                    result.append(('link', {
-                        'url': earliest_match.group(1),
-                        'text': earliest_match.group(2)
-                    }))
-                elif earliest_type == 'link_simple':
-                    url = earliest_match.group(1)
-                    result.append(('link', {
-                        'url': url,
-                        'text': url
-                    }))
-                elif earliest_type == 'bold':
-                    result.append(('bold', {'content': earliest_match.group(1)}))
-                elif earliest_type == 'italic':
-                    result.append(('italic', {'content': earliest_match.group(1)}))
-                elif earliest_type == 'underline':
-                    result.append(('underline', {'content': earliest_match.group(1)}))
-                elif earliest_type == 'equation_inline':
-                    result.append(('equation_inline', {'content': earliest_match.group(1)}))
-                
-                pos = earliest_match.end()
-            else:
+            match = _INLINE_RE.search(text, pos)
+            if not match:
                 # No more matches, add remaining text
                 result.append(('text', {'content': text[pos:]}))
                 break
+            
+            # Add any text before the match
+            if match.start() > pos:
+                result.append(('text', {'content': text[pos:match.start()]}))
+            
+            # The matched alternative's own groups follow its wrapping group
+            match_type = match.lastgroup
+            first = _INLINE_RE.groupindex[match_type] + 1
+            if match_type == 'link':
+                result.append(('link', {
+                    'url': match.group(first),
+                    'text': match.group(first + 1)
+                }))
+            elif match_type == 'link_simple':
+                url = match.group(first)
+                result.append(('link', {
+                    'url': url,
+                    'text': url
+                }))
+            else:
+                # bold, underline, italic and equation_inline carry their content
+                result.append((match_type, {'content': match.group(first)}))
+            
+            pos = match.end()
         
         return result
 
@@ -6,10 +6,24 @@ Reusable UI components for reports including navigation sidebar,
 search functionality, and common styling.
 """
 
-from typing import List, Dict, Optional
+from bisect import bisect_left
+from functools import lru_cache
+from html import escape
+from typing import List, Dict, Optional, Tuple
 from .static_helper import get_css_links
 
 
+@lru_cache(maxsize=8)
+def _page_dropdown_items(pages: Tuple[str, ...]) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+    """Sorted page names and their dropdown links, shared by every page's nav bar"""
+    ordered = tuple(sorted(pages))
+    items = tuple(
+        f'<a href="{escape(page)}_accessibility.html" class="nav-dropdown-item">{escape(page)}</a>'
+        for page in ordered
+    )
+    return ordered, items
+
+
 def get_navigation_sidebar(current_page: str, page_list: Optional[List[str]] = None, show_broken_links: bool = False) -> str:
     """
     Generate persistent navigation sidebar for all reports
@@ -247,11 +261,15 @@ def get_breadcrumb_navigation(
     # Build pages dropdown
     pages_dropdown_html = ''
     if page_list:
-        page_items = []
-        for page in sorted(page_list):
-            is_current = (current_page == 'page_detail' and current_page_name == page)
-            current_class = ' current' if is_current else ''
-            page_items.append(f'<a href="{page}_accessibility.html" class="nav-dropdown-item{current_class}">{page}</a>')
+        # The sorted link list is built once per page list; only the current
+        # page's entry differs between the detailed reports
+        ordered, page_items = _page_dropdown_items(tuple(page_list))
+        if current_page == 'page_detail' and current_page_name is not None:
+            index = bisect_left(ordered, current_page_name)
+            if index < len(ordered) and ordered[index] == current_page_name:
+                page_items = list(page_items)
+                name = escape(current_page_name)
+                page_items[index] = f'<a href="{name}_accessibility.html" class="nav-dropdown-item current">{name}</a>'
 
         pages_items_html = '\n'.join(page_items)
         pages_dropdown_html = f'''
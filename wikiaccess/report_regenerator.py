@@ -11,20 +11,27 @@ This module consolidates all report regeneration logic that was scattered across
 Previously these patterns were duplicated 4+ times. Now it's a single facade.
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional
+import hashlib
+import json
 from .database import ConversionDatabase
 from .reporting import ReportGenerator
-from .image_reporting import ImageReportGenerator
+from .image_reporting import ImageReportGenerator, classify_alt_text
 from .hub_reporting import HubReportGenerator
 from .report_components import get_breadcrumb_navigation, build_report_header, build_stat_cards
 from .static_helper import get_css_links
+from . import report_components, static_helper, template_renderer
 from .template_renderer import TemplateRenderer
 
 
 class ReportRegenerator:
     """Facade for regenerating comprehensive reports from database."""
 
+    # Input hash of the broken links report last written, kept beside it
+    BROKEN_LINKS_KEY_FILE = '.broken_links_report.sha256'
+
     def __init__(self, output_dir: str):
         """Initialize regenerator.
 
@@ -35,45 +42,65 @@ class ReportRegenerator:
         self.reports_dir = self.output_dir / 'reports'
         self.reports_dir.mkdir(parents=True, exist_ok=True)
 
-    def regenerate_accessibility_report(self, db: ConversionDatabase) -> Optional[str]:
-        """Regenerate comprehensive accessibility report with all pages from database.
+    def _collect_page_reports(self, db: ConversionDatabase) -> dict:
+        """Build per-page HTML/DOCX score reports from the database in one pass.
+
+        The result feeds both the accessibility report and the landing hub,
+        so regenerate_all() reads the pages table once for both.
 
         Args:
             db: ConversionDatabase instance
 
         Returns:
-            Path to generated report, or None if error
+            Dict of {page_display_name: {'html': report, 'docx': report}}
         """
-        try:
-            all_pages = db.get_all_pages_with_scores()
-
-            if not all_pages:
-                return None
-
-            print(f"📋 Regenerating accessibility report ({len(all_pages)} pages)...")
-
-            reporter = ReportGenerator(str(self.reports_dir))
-
-            for page_data in all_pages:
-                page_id = page_data['page_id']
-                page_display_name = page_id.replace(':', '_')
-
-                html_report = {
+        # Stream rows in batches instead of materializing every page first.
+        # Issue lists stay per page rather than shared, since the dashboard
+        # and hub consume these reports on separate threads.
+        return {
+            page_data['display_name']: {
+                'html': {
                     'score_aa': page_data['html_wcag_aa_score'] or 0,
                     'score_aaa': page_data['html_wcag_aaa_score'] or 0,
                     'issues_aa': [],
                     'issues_aaa': [],
                     'warnings': []
-                }
-                docx_report = {
+                },
+                'docx': {
                     'score_aa': page_data['docx_wcag_aa_score'] or 0,
                     'score_aaa': page_data['docx_wcag_aaa_score'] or 0,
                     'issues_aa': [],
                     'issues_aaa': [],
                     'warnings': []
                 }
+            }
+            for page_data in db.iter_pages_with_scores()
+        }
+
+    def regenerate_accessibility_report(self, db: ConversionDatabase,
+                                        page_reports: Optional[dict] = None) -> Optional[str]:
+        """Regenerate comprehensive accessibility report with all pages from database.
+
+        Args:
+            db: ConversionDatabase instance
+            page_reports: Optional result of _collect_page_reports() to reuse
+
+        Returns:
+            Path to generated report, or None if error
+        """
+        try:
+            if page_reports is None:
+                page_reports = self._collect_page_reports(db)
 
-                reporter.add_page_reports(page_display_name, html_report, docx_report)
+            if not page_reports:
+                return None
+
+            print(f"📋 Regenerating accessibility report ({len(page_reports)} pages)...")
+
+            reporter = ReportGenerator(str(self.reports_dir))
+
+            for page_display_name, reports in page_reports.items():
+                reporter.add_page_reports(page_display_name, reports['html'], reports['docx'])
 
             reporter.generate_detailed_reports()
             report_path = reporter.generate_dashboard()
@@ -84,43 +111,51 @@ class ReportRegenerator:
             print(f"✗ Error regenerating accessibility report: {e}")
             return None
 
-    def regenerate_image_report(self, db: ConversionDatabase) -> Optional[str]:
+    def _collect_image_details(self, db: ConversionDatabase) -> list:
+        """Convert the images table into image_details dicts in one streamed pass.
+
+        Args:
+            db: ConversionDatabase instance
+
+        Returns:
+            List of image metadata dicts, with alt_text_quality set, as
+            expected by the image and hub reports
+        """
+        images_dir = self.output_dir / 'images'
+        image_details = []
+
+        # The row already carries every column under its report key, so copy
+        # it in one C-level dict() call and add the derived fields. Alt text
+        # is classified here, so the image report and hub that share these
+        # dicts only ever read them.
+        for img_data in db.iter_images_for_report():
+            image = dict(img_data)
+            local_filename = image['local_filename']
+            image['local_path'] = str(images_dir / local_filename) if local_filename else None
+            image['alt_text_quality'] = classify_alt_text(image)
+            image_details.append(image)
+
+        return image_details
+
+    def regenerate_image_report(self, db: ConversionDatabase,
+                                image_details: Optional[list] = None) -> Optional[str]:
         """Regenerate comprehensive image report with all images from database.
 
         Args:
             db: ConversionDatabase instance
+            image_details: Optional result of _collect_image_details() to reuse
 
         Returns:
             Path to generated report, or None if error
         """
         try:
-            all_images = db.get_all_images_for_report()
+            if image_details is None:
+                image_details = self._collect_image_details(db)
 
-            if not all_images:
+            if not image_details:
                 return None
 
-            print(f"📸 Regenerating image report ({len(all_images)} images)...")
-
-            # Convert database rows to image_details format
-            image_details = []
-            for img_data in all_images:
-                local_filename = img_data['local_filename']
-                local_path = str(self.output_dir / 'images' / local_filename) if local_filename else None
-
-                img_dict = {
-                    'page_id': img_data['page_id'],
-                    'type': img_data['type'],
-                    'source_url': img_data['source_url'],
-                    'local_filename': local_filename,
-                    'local_path': local_path,
-                    'status': img_data['status'],
-                    'file_size': img_data['file_size'],
-                    'dimensions': img_data['dimensions'],
-                    'alt_text': img_data['alt_text'],
-                    'error_message': img_data['error_message'],
-                    'downloaded_at': img_data['downloaded_at']
-                }
-                image_details.append(img_dict)
+            print(f"📸 Regenerating image report ({len(image_details)} images)...")
 
             reporter = ImageReportGenerator(str(self.output_dir))
             report_path = reporter.generate_image_report(image_details)
@@ -134,41 +169,27 @@ class ReportRegenerator:
 
     def regenerate_landing_hub(self, db: ConversionDatabase,
                                image_details: Optional[list] = None,
-                               link_stats: Optional[dict] = None) -> Optional[str]:
+                               link_stats: Optional[dict] = None,
+                               page_reports: Optional[dict] = None) -> Optional[str]:
         """Regenerate comprehensive landing hub with all pages from database.
 
         Args:
             db: ConversionDatabase instance
             image_details: Optional image details for hub
             link_stats: Optional link statistics for hub
+            page_reports: Optional result of _collect_page_reports() to reuse
 
         Returns:
             Path to generated report, or None if error
         """
         try:
-            all_pages = db.get_all_pages_with_scores()
+            if page_reports is None:
+                page_reports = self._collect_page_reports(db)
 
-            if not all_pages:
+            if not page_reports:
                 return None
 
-            print(f"🏠 Regenerating landing hub ({len(all_pages)} pages)...")
-
-            # Build page_reports dict
-            page_reports = {}
-            for page_data in all_pages:
-                page_id = page_data['page_id']
-                page_display_name = page_id.replace(':', '_')
-
-                page_reports[page_display_name] = {
-                    'html': {
-                        'score_aa': page_data['html_wcag_aa_score'] or 0,
-                        'score_aaa': page_data['html_wcag_aaa_score'] or 0,
-                    },
-                    'docx': {
-                        'score_aa': page_data['docx_wcag_aa_score'] or 0,
-                        'score_aaa': page_data['docx_wcag_aaa_score'] or 0,
-                    }
-                }
+            print(f"🏠 Regenerating landing hub ({len(page_reports)} pages)...")
 
             hub_generator = HubReportGenerator(str(self.output_dir))
             report_path = hub_generator.generate_hub(
@@ -195,11 +216,29 @@ class ReportRegenerator:
         """
         try:
             all_broken = db.get_all_broken_links()
-            page_names_list = db.get_pages_with_broken_links()
 
-            if not all_broken or not page_names_list:
+            if not all_broken:
                 return None
 
+            report_path = self.reports_dir / 'broken_links_report.html'
+            key_path = self.reports_dir / self.BROKEN_LINKS_KEY_FILE
+            report_key = self._broken_links_report_key(all_broken)
+            try:
+                unchanged = report_path.exists() and key_path.read_text(encoding='utf-8') == report_key
+            except OSError:
+                unchanged = False
+            if unchanged:
+                print(f"✓ Broken links report (unchanged): {report_path}")
+                return str(report_path)
+
+            # Source pages come from the grouped rows' referenced_by lists,
+            # saving a second DISTINCT scan of the links table
+            page_names_list = sorted({
+                source
+                for link in all_broken if link['referenced_by']
+                for source in link['referenced_by'].split(',')
+            })
+
             print(f"🔗 Regenerating broken links report ({len(all_broken)} links)...")
 
             # Build report components
@@ -213,9 +252,10 @@ class ReportRegenerator:
                 ]
             )
 
+            totals = db.get_broken_link_summary()
             stats_html = build_stat_cards([
-                {'value': len(all_broken), 'label': 'Broken Links', 'color': '#dc3545'},
-                {'value': sum(link['reference_count'] for link in all_broken), 'label': 'Total References', 'color': '#ff8800'}
+                {'value': totals['targets'], 'label': 'Broken Links', 'color': '#dc3545'},
+                {'value': totals['references'], 'label': 'Total References', 'color': '#ff8800'}
             ], grid_size='narrow')
 
             css_links = get_css_links()
@@ -231,9 +271,9 @@ class ReportRegenerator:
             )
 
             # Write report
-            report_path = self.reports_dir / 'broken_links_report.html'
             with open(report_path, 'w', encoding='utf-8') as f:
                 f.write(html_content)
+            key_path.write_text(report_key, encoding='utf-8')
 
             print(f"✓ Broken links report: {report_path}")
             return str(report_path)
@@ -242,6 +282,31 @@ class ReportRegenerator:
             print(f"✗ Error regenerating broken links report: {e}")
             return None
 
+    def _broken_links_report_key(self, all_broken: list) -> str:
+        """Hash of everything the broken links report is rendered from
+
+        The stats and navigation are derived from the broken link rows, so
+        those rows plus the template and markup modules' mtimes determine
+        the output.
+
+        Args:
+            all_broken: Rows from get_all_broken_links()
+        """
+        sources = [
+            Path(template_renderer.__file__).parent / 'templates' / 'broken_links_report.html',
+            Path(__file__), Path(report_components.__file__),
+            Path(static_helper.__file__), Path(template_renderer.__file__)
+        ]
+        mtimes = []
+        for source in sources:
+            try:
+                mtimes.append(source.stat().st_mtime_ns)
+            except OSError:
+                mtimes.append(None)
+
+        payload = json.dumps([all_broken, mtimes], sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
     def regenerate_all(self, db: ConversionDatabase,
                       image_details: Optional[list] = None,
                       link_stats: Optional[dict] = None) -> dict:
@@ -257,43 +322,39 @@ class ReportRegenerator:
         """
         print(f"\n{'='*70}\nRegenerating All Reports\n{'='*70}\n")
 
-        # Gather image details if not provided
+        # The images table is read once; the image report and the hub share it
+        db_image_details = self._collect_image_details(db)
         if not image_details:
-            all_images = db.get_all_images_for_report()
-            if all_images:
-                image_details = []
-                for img_data in all_images:
-                    local_filename = img_data['local_filename']
-                    local_path = str(self.output_dir / 'images' / local_filename) if local_filename else None
-                    image_details.append({
-                        'page_id': img_data['page_id'],
-                        'type': img_data['type'],
-                        'source_url': img_data['source_url'],
-                        'local_filename': local_filename,
-                        'local_path': local_path,
-                        'status': img_data['status'],
-                        'file_size': img_data['file_size'],
-                        'dimensions': img_data['dimensions'],
-                        'alt_text': img_data['alt_text'],
-                        'error_message': img_data['error_message'],
-                        'downloaded_at': img_data['downloaded_at']
-                    })
+            image_details = db_image_details
 
         # Compute link_stats from database if not provided
         if not link_stats:
-            all_broken = db.get_all_broken_links()
+            totals = db.get_broken_link_summary()
             link_stats = {
-                'links_found': sum(link['reference_count'] for link in all_broken),
+                'links_found': totals['references'],
                 'links_rewritten': 0,
-                'links_broken': len(all_broken)
+                'links_broken': totals['targets']
             }
 
-        results = {
-            'accessibility': self.regenerate_accessibility_report(db),
-            'image': self.regenerate_image_report(db),
-            'hub': self.regenerate_landing_hub(db, image_details, link_stats),
-            'broken_links': self.regenerate_broken_links_report(db),
-        }
+        # One pass over the pages table serves both the dashboard and the hub
+        page_reports = self._collect_page_reports(db)
+
+        # The dashboard, image report and hub run side by side on the data
+        # loaded above. They share page_reports and db_image_details, which
+        # they only read: alt text is classified in _collect_image_details(),
+        # so the image report has nothing left to write into the shared rows.
+        # The broken links report still queries the database, which stays on
+        # this thread because the SQLite connection can't be shared across threads.
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            futures = {
+                'accessibility': executor.submit(self.regenerate_accessibility_report, db, page_reports),
+                'image': executor.submit(self.regenerate_image_report, db, db_image_details),
+                'hub': executor.submit(self.regenerate_landing_hub, db, image_details, link_stats, page_reports),
+            }
+            broken_links_path = self.regenerate_broken_links_report(db)
+
+        results = {name: future.result() for name, future in futures.items()}
+        results['broken_links'] = broken_links_path
 
         print(f"\n{'='*70}")
         print(f"Report Regeneration Complete")
@@ -13,23 +13,33 @@ Part of WikiAccess: Transform DokuWiki into Accessible Documents
 https://github.com/yourusername/wikiaccess
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List, Dict, Optional
 from datetime import datetime
+import hashlib
 import html as html_lib
+import json
 import os
+import sys
 from markupsafe import Markup
 from .report_components import (
     get_breadcrumb_navigation, get_breadcrumb_javascript,
     build_report_header, build_stat_cards, build_action_buttons
 )
 from .static_helper import get_css_links
+from . import report_components, static_helper, template_renderer
 from .template_renderer import TemplateRenderer
 
 
 class ReportGenerator:
     """Generate accessibility compliance reports"""
 
+    # page_name -> input hash of the detailed report last written for it
+    REPORT_CACHE_FILE = '.report_cache.json'
+    # Per-page progress lines are written to stdout in chunks of this size
+    PROGRESS_FLUSH_EVERY = 500
+
     def __init__(self, output_dir: str = 'output', db=None):
         self.output_dir = Path(output_dir)
         self.page_reports = {}  # page_name -> {html_report, docx_report}
@@ -59,23 +69,117 @@ class ReportGenerator:
         print(f"\n📊 Accessibility Dashboard: {dashboard_path}")
         return str(dashboard_path)
     
-    def generate_detailed_reports(self):
-        """Generate detailed reports for all pages"""
-        for page_name, reports in self.page_reports.items():
+    def generate_detailed_reports(self, max_workers: Optional[int] = None):
+        """Generate detailed reports for all pages
+
+        Pages are independent, so they are rendered and written on a thread
+        pool; progress is still printed in page order, buffered and flushed
+        every PROGRESS_FLUSH_EVERY pages.
+
+        Args:
+            max_workers: Number of worker threads (defaults to CPU count, at most 8)
+        """
+        if max_workers is None:
+            max_workers = min(8, os.cpu_count() or 1)
+
+        # Navigation inputs are the same for every page, so look them up once
+        page_list = list(self.page_reports.keys())
+        broken_links_exists = (self.output_dir / 'broken_links_report.html').exists()
+        try:
+            existing_files = {entry.name for entry in os.scandir(self.output_dir)}
+        except FileNotFoundError:
+            existing_files = set()
+
+        # Pages whose report inputs hash the same as last run are not rebuilt
+        previous_keys = self._load_report_cache()
+        shared_inputs = self._shared_report_inputs(page_list, broken_links_exists)
+        report_keys = {}
+
+        def build_and_write(page_name, reports):
             report_path = self.output_dir / f'{page_name}_accessibility.html'
-            
-            html = self._build_combined_detail_html(
-                page_name, 
-                reports['html'], 
-                reports['docx'],
-                reports.get('html_stats'),
-                reports.get('docx_stats')
+
+            # Stream the template output to disk rather than building the string
+            self.template_renderer.stream_page_report(
+                str(report_path),
+                **self._combined_detail_context(page_name, reports['html'], reports['docx'],
+                                                page_list, broken_links_exists)
             )
-            
-            with open(report_path, 'w', encoding='utf-8') as f:
-                f.write(html)
-            
-            print(f"  ✓ Detailed report: {report_path}")
+
+            return report_path
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = []
+            for page_name, reports in self.page_reports.items():
+                key = self._detail_report_key(page_name, reports, shared_inputs)
+                report_keys[page_name] = key
+                report_path = self.output_dir / f'{page_name}_accessibility.html'
+                if previous_keys.get(page_name) == key and report_path.name in existing_files:
+                    futures.append((report_path, None))
+                else:
+                    futures.append((report_path, executor.submit(build_and_write, page_name, reports)))
+
+            progress = []
+            for report_path, future in futures:
+                if future is None:
+                    progress.append(f"  ✓ Detailed report (unchanged): {report_path}\n")
+                else:
+                    progress.append(f"  ✓ Detailed report: {future.result()}\n")
+                if len(progress) >= self.PROGRESS_FLUSH_EVERY:
+                    sys.stdout.write(''.join(progress))
+                    sys.stdout.flush()
+                    progress.clear()
+            sys.stdout.write(''.join(progress))
+            sys.stdout.flush()
+
+        self._save_report_cache({**previous_keys, **report_keys})
+
+    def _shared_report_inputs(self, page_list: List[str], broken_links_exists: bool) -> str:
+        """Digest of the inputs every detailed report depends on
+
+        Covers the page list and broken-links link shown in the navigation,
+        plus the template and the modules that build the report markup, so
+        code or template changes invalidate all cached reports.
+
+        Args:
+            page_list: Page names shown in the navigation
+            broken_links_exists: Whether the navigation links the broken-links report
+        """
+        sources = [
+            Path(template_renderer.__file__).parent / 'templates' / 'page_report.html',
+            Path(__file__), Path(report_components.__file__),
+            Path(static_helper.__file__), Path(template_renderer.__file__)
+        ]
+        mtimes = []
+        for source in sources:
+            try:
+                mtimes.append(source.stat().st_mtime_ns)
+            except OSError:
+                mtimes.append(None)
+
+        inputs = [sorted(page_list), broken_links_exists, mtimes]
+        return hashlib.sha256(json.dumps(inputs).encode('utf-8')).hexdigest()
+
+    def _detail_report_key(self, page_name: str, reports: Dict, shared_inputs: str) -> str:
+        """Hash of everything a page's detailed report is rendered from"""
+        payload = json.dumps([shared_inputs, page_name, reports['html'], reports['docx']],
+                             sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def _load_report_cache(self) -> Dict[str, str]:
+        """Load the page -> report input hash map written by the previous run"""
+        try:
+            with open(self.output_dir / self.REPORT_CACHE_FILE, encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _save_report_cache(self, keys: Dict[str, str]):
+        """Persist the page -> report input hash map for the next run"""
+        try:
+            with open(self.output_dir / self.REPORT_CACHE_FILE, 'w', encoding='utf-8') as f:
+                json.dump(keys, f)
+        except OSError as e:
+            print(f"⚠ Could not save report cache: {e}")
     
     def _build_dashboard_html(self) -> str:
         """Build dashboard HTML using template renderer"""
@@ -196,10 +300,24 @@ class ReportGenerator:
     def _build_combined_detail_html(self, page_name: str, html_report: Dict, docx_report: Dict,
                                     html_stats: Optional[Dict] = None, docx_stats: Optional[Dict] = None) -> str:
         """Build combined detailed report HTML using Jinja2 template"""
+        return self.template_renderer.render_page_report(
+            **self._combined_detail_context(page_name, html_report, docx_report)
+        )
+
+    def _combined_detail_context(self, page_name: str, html_report: Dict, docx_report: Dict,
+                                 page_list: Optional[List[str]] = None,
+                                 broken_links_exists: Optional[bool] = None) -> Dict:
+        """Build the render_page_report() arguments for a page's detailed report
+
+        page_list and broken_links_exists can be passed in when building many
+        reports, so the page list and the broken-links stat happen once.
+        """
 
         # Build breadcrumb navigation
-        page_list = list(self.page_reports.keys())
-        broken_links_exists = (self.output_dir / 'broken_links_report.html').exists()
+        if page_list is None:
+            page_list = list(self.page_reports.keys())
+        if broken_links_exists is None:
+            broken_links_exists = (self.output_dir / 'broken_links_report.html').exists()
         nav_html = get_breadcrumb_navigation('page_detail', current_page_name=page_name, page_list=page_list, show_broken_links=broken_links_exists)
 
         # Build header with breadcrumb
@@ -223,17 +341,16 @@ class ReportGenerator:
         # Prepare CSS links
         css_links = get_css_links()
 
-        # Use template renderer
-        return self.template_renderer.render_page_report(
-            page_name=page_name,
-            html_report=html_report,
-            docx_report=docx_report,
-            css_links=css_links,
-            navigation=nav_html,
-            breadcrumb='',  # Included in header
-            header=header_html,
-            actions=actions
-        )
+        return {
+            'page_name': page_name,
+            'html_report': html_report,
+            'docx_report': docx_report,
+            'css_links': css_links,
+            'navigation': nav_html,
+            'breadcrumb': '',  # Included in header
+            'header': header_html,
+            'actions': actions
+        }
     
     
     def _get_score_color(self, score: float) -> str:
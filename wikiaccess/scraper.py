@@ -10,11 +10,26 @@ https://github.com/yourusername/wikiaccess
 
 import re
 import requests
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from urllib.parse import urljoin, urlparse, parse_qs
 from pathlib import Path
 from typing import Optional, Dict, List, Tuple
-from bs4 import BeautifulSoup
+import lxml.html
 import time
+from .static_helper import write_bytes_atomic
+
+
+def _parse_html(markup: str):
+    """Parse an HTML page into an lxml element tree, or None for an empty body.
+
+    Lookups then run as XPath in lxml's C code instead of walking Python
+    wrapper objects.
+    """
+    if not markup or not markup.strip():
+        return None
+    return lxml.html.document_fromstring(markup)
 
 
 class DokuWikiHTTPClient:
@@ -22,6 +37,11 @@ class DokuWikiHTTPClient:
     Fetch DokuWiki content via HTTP scraping
     No XML-RPC API required!
     """
+
+    # Concurrent requests used by prefetch_pages (also the connection pool size)
+    MAX_CONCURRENT_REQUESTS = 16
+    # (connect, read) seconds to wait for a page before giving up
+    REQUEST_TIMEOUT = (5, 30)
     
     def __init__(self, base_url: str, username: Optional[str] = None, 
                  password: Optional[str] = None):
@@ -38,6 +58,14 @@ class DokuWikiHTTPClient:
         self.session.headers.update({
             'User-Agent': 'DokuWiki-to-Word-Converter/1.0'
         })
+        # Keep enough pooled keep-alive connections for concurrent fetches,
+        # and retry dropped connections rather than failing the page
+        adapter = HTTPAdapter(pool_connections=self.MAX_CONCURRENT_REQUESTS,
+                              pool_maxsize=self.MAX_CONCURRENT_REQUESTS,
+                              max_retries=Retry(total=3, backoff_factor=0.3))
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        self._prefetched = {}  # page_id -> raw content from prefetch_pages()
         
         # Login if credentials provided
         if username and password:
@@ -50,11 +78,11 @@ class DokuWikiHTTPClient:
         try:
             # Get login page to get sectok
             response = self.session.get(login_url)
-            soup = BeautifulSoup(response.text, 'html.parser')
+            root = _parse_html(response.text)
             
             # Find sectok (security token)
-            sectok_input = soup.find('input', {'name': 'sectok'})
-            sectok = sectok_input['value'] if sectok_input else ''
+            sectok_values = root.xpath('//input[@name="sectok"]/@value') if root is not None else []
+            sectok = sectok_values[0] if sectok_values else ''
             
             # Submit login
             login_data = {
@@ -87,19 +115,63 @@ class DokuWikiHTTPClient:
         Returns:
             Raw DokuWiki syntax or None if failed
         """
-        # Use the export_raw action to get raw wiki syntax
-        url = f"{self.base_url}/doku.php?id={page_id}&do=export_raw"
-        
+        # Served from prefetch_pages() if it was fetched ahead of time
+        content = self._prefetched.pop(page_id, None)
+        if content is not None:
+            return content
+
         try:
-            response = self.session.get(url)
-            response.raise_for_status()
-            
+            content = self._fetch_raw(page_id)
             print(f"✓ Fetched page: {page_id}")
-            return response.text
+            return content
             
         except Exception as e:
             print(f"✗ Failed to fetch {page_id}: {e}")
             return None
+
+    def _fetch_raw(self, page_id: str) -> str:
+        """Fetch raw DokuWiki syntax for a page, raising on failure"""
+        # Use the export_raw action to get raw wiki syntax
+        url = f"{self.base_url}/doku.php?id={page_id}&do=export_raw"
+        response = self.session.get(url, timeout=self.REQUEST_TIMEOUT)
+        response.raise_for_status()
+        return response.text
+
+    def prefetch_pages(self, page_ids: List[str]) -> int:
+        """
+        Fetch raw syntax for many pages concurrently ahead of conversion
+
+        Page fetches are latency-bound, so overlapping them makes the total
+        wait close to the slowest page instead of the sum of all pages.
+        Results are held until get_page_raw() asks for them; failed pages
+        are simply fetched (and reported) again at that point.
+
+        Args:
+            page_ids: Page identifiers to fetch
+
+        Returns:
+            Number of pages fetched successfully
+        """
+        pending = [page_id for page_id in dict.fromkeys(page_ids) if page_id not in self._prefetched]
+        if not pending:
+            return 0
+
+        def fetch(page_id):
+            try:
+                return page_id, self._fetch_raw(page_id)
+            except Exception:
+                return page_id, None
+
+        fetched = 0
+        workers = min(self.MAX_CONCURRENT_REQUESTS, len(pending))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for page_id, content in executor.map(fetch, pending):
+                if content is not None:
+                    self._prefetched[page_id] = content
+                    fetched += 1
+
+        print(f"✓ Prefetched {fetched}/{len(pending)} pages")
+        return fetched
     
     def get_page_from_url(self, url: str) -> Optional[Tuple[str, str]]:
         """
@@ -176,8 +248,7 @@ class DokuWikiHTTPClient:
                 content_type = response.headers.get('Content-Type', '')
                 if response.status_code == 200 and ('image/' in content_type or 'application/' in content_type):
                     Path(output_path).parent.mkdir(parents=True, exist_ok=True)
-                    with open(output_path, 'wb') as f:
-                        f.write(response.content)
+                    write_bytes_atomic(output_path, response.content)
                     
                     print(f"✓ Downloaded: {media_path}")
                     return True
@@ -204,11 +275,10 @@ class DokuWikiHTTPClient:
         # Try high quality first, fall back to standard
         for url in [info['thumbnail_url'], info['thumbnail_hq']]:
             try:
-                response = requests.get(url, timeout=10)
+                response = self.session.get(url, timeout=10)
                 if response.status_code == 200:
                     Path(output_path).parent.mkdir(parents=True, exist_ok=True)
-                    with open(output_path, 'wb') as f:
-                        f.write(response.content)
+                    write_bytes_atomic(output_path, response.content)
                     print(f"✓ Downloaded YouTube thumbnail: {video_id}")
                     return True
             except:
@@ -244,13 +314,15 @@ class DokuWikiHTTPClient:
         """
         try:
             url = f"{self.base_url}/doku.php?do=index"
-            response = self.session.get(url)
-            soup = BeautifulSoup(response.text, 'html.parser')
+            response = self.session.get(url, timeout=self.REQUEST_TIMEOUT)
+            root = _parse_html(response.text)
+            if root is None:
+                return []
             
             pages = []
-            # Look for page links in the index
-            for link in soup.find_all('a', {'class': 'wikilink1'}):
-                href = link.get('href', '')
+            # Look for page links in the index; the class test also matches
+            # multi-valued classes such as "wikilink1 curid"
+            for href in root.xpath('//a[contains(concat(" ", normalize-space(@class), " "), " wikilink1 ")]/@href'):
                 if 'id=' in href:
                     page_id = parse_qs(urlparse(href).query).get('id', [None])[0]
                     if page_id:
@@ -2,8 +2,99 @@
 Helper functions for managing static files (CSS, JS, etc.)
 """
 
+from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path
+import os
 import shutil
+import tempfile
+
+
+def write_text_atomic(path, content: str):
+    """
+    Replace a file's contents atomically.
+
+    The text is written to a temporary file in the same directory and then
+    renamed over the target, so readers never see a half-written file and a
+    crash mid-write leaves the original intact.
+
+    Args:
+        path: File to write
+        content: Text to write (UTF-8)
+    """
+    with open_atomic(path, 'w', encoding='utf-8') as f:
+        f.write(content)
+
+
+def write_bytes_atomic(path, content: bytes):
+    """
+    Replace a file's contents atomically with binary data.
+
+    Used for downloaded images, where concurrent conversions may fetch the
+    same media file at once; each writer renames a complete file into place.
+
+    Args:
+        path: File to write
+        content: Bytes to write
+    """
+    with open_atomic(path, 'wb') as f:
+        f.write(content)
+
+
+@contextmanager
+def open_atomic(path, mode: str = 'w', encoding: str = None, buffering: int = -1):
+    """
+    Open a temporary sibling of path for writing, renamed over path on success.
+
+    For output written incrementally (e.g. a streamed template), so a render
+    that fails partway leaves the previous file rather than a truncated one.
+
+    Args:
+        path: File to write
+        mode: 'w' or 'wb'
+        encoding: Text encoding for mode 'w'
+        buffering: Buffer size, as for open()
+
+    Yields:
+        The open temporary file
+    """
+    path = Path(path)
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f'.{path.name}.', suffix='.tmp')
+    try:
+        with os.fdopen(fd, mode, buffering=buffering, encoding=encoding) as f:
+            yield f
+        # mkstemp creates the file as 0600; keep the permissions of the file being replaced
+        if path.exists():
+            shutil.copymode(path, tmp_path)
+        else:
+            os.chmod(tmp_path, 0o644)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def _copy_if_changed(src: Path, dest: Path):
+    """
+    Copy src to dest unless dest already matches it.
+
+    copy2 preserves mtime to the nanosecond, so an unchanged size and
+    mtime means the file was copied on an earlier run and can be skipped.
+    """
+    src_stat = src.stat()
+    try:
+        dest_stat = dest.stat()
+    except FileNotFoundError:
+        dest_stat = None
+
+    if (dest_stat is not None and dest_stat.st_size == src_stat.st_size
+            and dest_stat.st_mtime_ns == src_stat.st_mtime_ns):
+        return
+
+    shutil.copy2(src, dest)
 
 
 def copy_static_files(output_dir: str):
@@ -23,7 +114,7 @@ def copy_static_files(output_dir: str):
 
     if css_src.exists():
         for css_file in css_src.glob('*.css'):
-            shutil.copy2(css_file, css_dest / css_file.name)
+            _copy_if_changed(css_file, css_dest / css_file.name)
     else:
         print(f"Warning: CSS directory not found: {css_src}")
 
@@ -34,17 +125,21 @@ def copy_static_files(output_dir: str):
 
     if js_src.exists():
         for js_file in js_src.glob('*.js'):
-            shutil.copy2(js_file, js_dest / js_file.name)
+            _copy_if_changed(js_file, js_dest / js_file.name)
     else:
         print(f"Warning: JS directory not found: {js_src}")
 
     return css_dest
 
 
+@lru_cache(maxsize=None)
 def get_css_links():
     """
     Get HTML link tags for all CSS files.
 
+    The tags never change within a run, so the string is built once and
+    shared by every report (one call per detailed page report otherwise).
+
     Returns:
         HTML string with link tags
     """
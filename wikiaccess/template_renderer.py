@@ -10,10 +10,30 @@ This ensures:
 - Maintainable code
 """
 
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Any, List, Optional
 from jinja2 import Environment, FileSystemLoader, select_autoescape
 from markupsafe import Markup
+from .static_helper import open_atomic
+
+
+@lru_cache(maxsize=None)
+def _get_environment(template_dir: str) -> Environment:
+    """Return the Jinja2 environment for template_dir, created once per process.
+
+    Every report generator builds its own TemplateRenderer, so sharing the
+    environment lets them reuse each other's compiled templates instead of
+    re-parsing them. Templates ship with the package and do not change while
+    running, so auto_reload's mtime check on every lookup is disabled.
+    """
+    return Environment(
+        loader=FileSystemLoader(template_dir),
+        autoescape=select_autoescape(['html', 'xml']),
+        trim_blocks=True,
+        lstrip_blocks=True,
+        auto_reload=False
+    )
 
 
 class TemplateRenderer:
@@ -28,13 +48,8 @@ class TemplateRenderer:
         self.output_dir = Path(output_dir)
         template_dir = Path(__file__).parent / "templates"
 
-        # Initialize Jinja2 environment
-        self.env = Environment(
-            loader=FileSystemLoader(template_dir),
-            autoescape=select_autoescape(['html', 'xml']),
-            trim_blocks=True,
-            lstrip_blocks=True
-        )
+        # Shared Jinja2 environment (compiled templates are cached across instances)
+        self.env = _get_environment(str(template_dir))
 
     def render_page_report(
         self,
@@ -63,6 +78,38 @@ class TemplateRenderer:
             Rendered HTML string
         """
         template = self.env.get_template("page_report.html")
+        return template.render(**self._page_report_context(
+            page_name, html_report, docx_report, css_links, navigation, breadcrumb, header, actions
+        ))
+
+    def stream_page_report(self, output_path: str, **kwargs) -> None:
+        """Render a page accessibility report straight to a file.
+
+        Template output is written chunk by chunk as it is generated, so the
+        full document is never held in memory as one string. It goes to a
+        temporary file renamed into place, so a failed render leaves no
+        truncated report.
+
+        Args:
+            output_path: Destination file path
+            **kwargs: Same arguments as render_page_report()
+        """
+        template = self.env.get_template("page_report.html")
+        with open_atomic(output_path, 'w', encoding='utf-8', buffering=1 << 16) as f:
+            template.stream(**self._page_report_context(**kwargs)).dump(f)
+
+    def _page_report_context(
+        self,
+        page_name: str,
+        html_report: Dict[str, Any],
+        docx_report: Dict[str, Any],
+        css_links: str,
+        navigation: str,
+        breadcrumb: str,
+        header: str,
+        actions: List[Dict[str, str]]
+    ) -> Dict[str, Any]:
+        """Build the template context for page_report.html."""
 
         # Helper to format issues
         def format_issues(issue_list, level='error'):
@@ -125,7 +172,7 @@ class TemplateRenderer:
             }
         ]
 
-        return template.render(
+        return dict(
             page_name=page_name,
             css_links=Markup(css_links),
             navigation=Markup(navigation),
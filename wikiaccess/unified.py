@@ -12,6 +12,7 @@ Uses Markdown as intermediate format:
 4. Generate reports
 """
 
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, Dict, Any
 from datetime import datetime
@@ -31,6 +32,12 @@ from .discovery_orchestrator import DiscoveryOrchestrator
 from .accessibility_handler import AccessibilityIssueHandler
 
 
+@lru_cache(maxsize=None)
+def _shared_client(wiki_url: str) -> DokuWikiHTTPClient:
+    """Return one HTTP client per wiki so repeated calls reuse its pooled connections"""
+    return DokuWikiHTTPClient(wiki_url)
+
+
 def convert_wiki_page(
     wiki_url: str,
     page_name: str,
@@ -97,7 +104,7 @@ def convert_wiki_page(
         db.start_batch(batch_id, wiki_url)
 
     # Initialize components
-    client = DokuWikiHTTPClient(wiki_url)
+    client = _shared_client(wiki_url)
     converter = MarkdownConverter(client, output_dir, include_accessibility_toolbar)
     results = {}
 
@@ -134,16 +141,8 @@ def convert_wiki_page(
 
     # Run accessibility checks if requested
     if check_accessibility:
-        checker = AccessibilityChecker()
-        accessibility_results = {}
-
-        if html_path:
-            html_accessibility = checker.check_html(html_path)
-            accessibility_results['html'] = html_accessibility
-
-        if docx_path:
-            docx_accessibility = checker.check_docx(docx_path)
-            accessibility_results['docx'] = docx_accessibility
+        checker = AccessibilityChecker(cache_dir=str(output_path / 'reports' / '.accessibility_cache'))
+        accessibility_results = checker.check_documents(html_path, docx_path)
 
         results['accessibility'] = accessibility_results
 
@@ -220,24 +219,27 @@ def convert_wiki_page(
             'conversion_duration_seconds': conversion_duration,
             'error_message': error_message
         }
-        db.add_page_conversion(page_data)
-
-        # Store image details
-        for img in converter.image_details:
-            img_data = {
-                'page_id': page_name,
-                'batch_id': batch_id,
-                'type': img.get('type', 'wiki_image'),
-                'source_url': img.get('source_url'),
-                'local_filename': img.get('local_filename'),
-                'status': img.get('status'),
-                'file_size': img.get('file_size'),
-                'dimensions': img.get('dimensions'),
-                'alt_text': img.get('alt_text'),
-                'alt_text_quality': 'missing' if not img.get('alt_text') else 'manual',
-                'error_message': img.get('error_message')
-            }
-            db.add_image(img_data)
+        # Page and image rows are committed together
+        with db.transaction():
+            db.add_page_conversion(page_data)
+
+            # Store image details
+            db.add_images([
+                {
+                    'page_id': page_name,
+                    'batch_id': batch_id,
+                    'type': img.get('type', 'wiki_image'),
+                    'source_url': img.get('source_url'),
+                    'local_filename': img.get('local_filename'),
+                    'status': img.get('status'),
+                    'file_size': img.get('file_size'),
+                    'dimensions': img.get('dimensions'),
+                    'alt_text': img.get('alt_text'),
+                    'alt_text_quality': 'missing' if not img.get('alt_text') else 'manual',
+                    'error_message': img.get('error_message')
+                }
+                for img in converter.image_details
+            ])
 
         # Store accessibility issues using handler
         if check_accessibility and results.get('accessibility'):
@@ -269,7 +271,8 @@ def convert_multiple_pages(
     skip_recent: bool = True,
     include_accessibility_toolbar: bool = True,
     enable_discovery: bool = True,
-    max_discovery_depth: int = 2
+    max_discovery_depth: int = 2,
+    jobs: int = 1
 ) -> Dict[str, Dict[str, Any]]:
     """
     Convert multiple DokuWiki pages to accessible documents (orchestrator wrapper).
@@ -305,6 +308,7 @@ def convert_multiple_pages(
         include_accessibility_toolbar: Whether to include toolbar in HTML (defaults to True)
         enable_discovery: Whether to auto-discover missing pages (defaults to True)
         max_discovery_depth: Max depth for page discovery (defaults to 2)
+        jobs: Number of pages to convert concurrently (defaults to 1)
 
     Returns:
         Dictionary mapping page names to their conversion results
@@ -333,7 +337,8 @@ def convert_multiple_pages(
         formats=formats,
         check_accessibility=check_accessibility,
         enable_discovery=enable_discovery,
-        skip_recent=skip_recent
+        skip_recent=skip_recent,
+        jobs=jobs
     )
 
     if db: